@@ -0,0 +1,46 @@
+# benchmarks/bench_connection_reuse.py
+# Usage: python -m benchmarks.bench_connection_reuse [--requests 200]
+import argparse
+import time
+import requests
+from benchmarks.stub_backend import start_stub
+from components import transport
+
+
+def run_cold(url, n):
+    # module-level requests.get: one fresh TCP connection per call
+    for _ in range(n):
+        requests.get(f"{url}/jobs/jobs/", timeout=5).json()
+
+
+def run_pooled(url, n):
+    # shared transport directly, so the APIClient read cache does not hide the network
+    for _ in range(n):
+        transport.get(f"{url}/jobs/jobs/").json()
+
+
+def measure(server, label, fn, n):
+    server.reset_stats()
+    start = time.perf_counter()
+    fn(server.url, n)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<8} requests={server.requests:<6} connections={server.connections:<6} "
+          f"total={elapsed * 1000:8.1f} ms  per_request={elapsed / n * 1000:6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cold vs pooled connections against a local stub.")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    server = start_stub()
+    try:
+        measure(server, "cold", run_cold, args.requests)
+        measure(server, "pooled", run_pooled, args.requests)
+    finally:
+        transport.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
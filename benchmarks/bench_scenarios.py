@@ -0,0 +1,338 @@
+# benchmarks/bench_scenarios.py
+# Usage: python -m benchmarks.bench_scenarios [--evaluations 1000 100000] [--scenarios health jobs_cached ...]
+#                                             [--dataset data/] [--seed 0]
+#                                             [--json results.json] [--baseline previous.json]
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+SCENARIOS = {}
+
+
+def scenario(name, iterations=50):
+    """Register fn(ctx) -> op; op() is timed once per iteration and may return an int row count."""
+    def wrap(fn):
+        SCENARIOS[name] = (fn, iterations)
+        return fn
+    return wrap
+
+
+# -----------------------
+# Scenarios (run inside a worker process, API_BASE_URL already set)
+# -----------------------
+@scenario("health", iterations=200)
+def health(ctx):
+    from components.api_client import APIClient
+    client = APIClient()
+    return client.health
+
+
+@scenario("login", iterations=200)
+def login(ctx):
+    from components import transport
+    form = {"username": "bench@example.com", "password": "secret", "grant_type": "password"}
+    return lambda: transport.post(f"{ctx['url']}/token", data=form).json()
+
+
+@scenario("jobs_cached", iterations=1000)
+def jobs_cached(ctx):
+    from components.api_client import APIClient
+    client = APIClient()
+    client.get_jobs()
+    return lambda: len(client.get_jobs())
+
+
+@scenario("jobs_uncached", iterations=200)
+def jobs_uncached(ctx):
+    from components.api_client import APIClient, clear_cache
+    client = APIClient()
+
+    def op():
+        clear_cache()
+        return len(client.get_jobs())
+    return op
+
+
+@scenario("jobs_concurrent", iterations=50)
+def jobs_concurrent(ctx):
+    # many sessions asking at once; single-flight should collapse them
+    from concurrent.futures import ThreadPoolExecutor
+    from components.api_client import APIClient, clear_cache
+    client = APIClient()
+    pool = ThreadPoolExecutor(max_workers=ctx["concurrency"])
+
+    def op():
+        clear_cache()
+        return sum(len(r) for r in pool.map(lambda _: client.get_jobs(), range(ctx["concurrency"])))
+    return op
+
+
+@scenario("evaluations_full", iterations=5)
+def evaluations_full(ctx):
+    from components.api_client import APIClient, clear_cache
+    client = APIClient()
+
+    def op():
+        clear_cache()
+        return len(client.get_evaluations())
+    return op
+
+
+@scenario("evaluations_paged", iterations=5)
+def evaluations_paged(ctx):
+    from components.api_client import APIClient
+    client = APIClient()
+    return lambda: sum(len(page) for page in client.iter_evaluation_pages(ctx["page_size"]))
+
+
+@scenario("evaluations_frames", iterations=5)
+def evaluations_frames(ctx):
+    from components.api_client import APIClient
+    from utils.evaluations import TABLE_COLUMNS
+    client = APIClient()
+    return lambda: sum(len(df) for df in client.iter_evaluation_frames(ctx["page_size"], TABLE_COLUMNS))
+
+
+@scenario("evaluations_delta", iterations=50)
+def evaluations_delta(ctx):
+    # nothing changed upstream: cost of an incremental refresh
+    from components.api_client import APIClient
+    client = APIClient()
+    client.sync_evaluations()
+    return lambda: len(client.sync_evaluations())
+
+
+@scenario("summary_local", iterations=5)
+def summary_local(ctx):
+    from components.api_client import APIClient
+    from utils.aggregates import summarize
+    client = APIClient()
+    evaluations, jobs = client.get_evaluations(), client.get_jobs()
+
+    def op():
+        # no frame key, so the evaluation_frame cache cannot answer
+        summarize([], list(evaluations), jobs)
+        return len(evaluations)
+    return op
+
+
+@scenario("candidates_index", iterations=5)
+def candidates_index(ctx):
+    from components.api_client import APIClient
+    from utils.evaluation_index import EvaluationIndex
+    from utils.evaluations import TABLE_COLUMNS, to_frame
+    frame = to_frame(APIClient().get_evaluations()).reindex(columns=TABLE_COLUMNS)
+    return lambda: len(EvaluationIndex(frame))
+
+
+@scenario("candidates_filter", iterations=200)
+def candidates_filter(ctx):
+    from components.api_client import APIClient
+    from utils.evaluation_index import EvaluationIndex
+    from utils.evaluations import TABLE_COLUMNS, to_frame
+    index = EvaluationIndex(to_frame(APIClient().get_evaluations()).reindex(columns=TABLE_COLUMNS))
+    return lambda: len(index.filter(40, 80, "High"))
+
+
+@scenario("upload", iterations=50)
+def upload(ctx):
+    from components import uploads
+    payload = os.urandom(ctx["upload_bytes"])
+
+    def op():
+        f = io.BytesIO(payload)
+        f.name = "resume.pdf"
+        uploads.upload_file(ctx["url"], f)
+        return None
+    return op
+
+
+@scenario("page_home", iterations=5)
+def page_home(ctx):
+    from streamlit.testing.v1 import AppTest
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def op():
+        at = AppTest.from_file(os.path.join(root, "main_app.py"), default_timeout=600)
+        at.session_state["current_page"] = "Home"
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return op
+
+
+@scenario("page_dashboard", iterations=3)
+def page_dashboard(ctx):
+    from streamlit.testing.v1 import AppTest
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def op():
+        at = AppTest.from_file(os.path.join(root, "dashboard_app.py"), default_timeout=600)
+        at.session_state["admin_token"] = "bench"
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return op
+
+
+# -----------------------
+# Worker
+# -----------------------
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scenario(name, ctx, iterations):
+    fn, _ = SCENARIOS[name]
+    op = fn(ctx)
+    op()  # warm-up: imports, connections, first cache fill
+    rss_ready = peak_rss_mb()
+    latencies, rows = [], 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        t = time.perf_counter()
+        count = op()
+        latencies.append(time.perf_counter() - t)
+        if isinstance(count, int):
+            rows += count
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def pct(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000.0
+
+    return {
+        "scenario": name,
+        "evaluations": ctx["evaluations"],
+        "iterations": iterations,
+        "p50_ms": pct(0.50),
+        "p90_ms": pct(0.90),
+        "p99_ms": pct(0.99),
+        "mean_ms": statistics.fmean(latencies) * 1000.0,
+        "ops_per_s": iterations / elapsed if elapsed else None,
+        "rows_per_s": rows / elapsed if rows and elapsed else None,
+        "rss_ready_mb": rss_ready,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def worker(args):
+    ctx = json.loads(args.worker_ctx)
+    result = run_scenario(args.worker, ctx, args.iterations or SCENARIOS[args.worker][1])
+    print(json.dumps(result))
+
+
+# -----------------------
+# Driver
+# -----------------------
+def spawn(name, ctx, iterations):
+    """One fresh interpreter per scenario, so peak RSS and caches are not shared."""
+    cmd = [sys.executable, "-m", "benchmarks.bench_scenarios", "--worker", name,
+           "--worker-ctx", json.dumps(ctx)]
+    if iterations:
+        cmd += ["--iterations", str(iterations)]
+    env = dict(os.environ, API_BASE_URL=ctx["url"])
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if proc.returncode != 0:
+        return {"scenario": name, "evaluations": ctx["evaluations"], "error": proc.stderr.strip().splitlines()[-1:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _fmt(value, spec):
+    return format(value, spec) if isinstance(value, (int, float)) else "-".rjust(len(format(0, spec)))
+
+
+def print_table(results, baseline=None):
+    base = {(r["scenario"], r["evaluations"]): r for r in baseline or [] if "error" not in r}
+    header = (f"{'scenario':<20} {'evals':>8} {'iters':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} "
+              f"{'ops/s':>9} {'rows/s':>11} {'peak MB':>8}")
+    if base:
+        header += f" {'p50 vs base':>12}"
+    print(header)
+    for r in results:
+        if "error" in r:
+            print(f"{r['scenario']:<20} {r['evaluations']:>8} ERROR {' '.join(r['error'])}")
+            continue
+        line = (f"{r['scenario']:<20} {r['evaluations']:>8} {r['iterations']:>6} {_fmt(r['p50_ms'], '9.2f')} "
+                f"{_fmt(r['p90_ms'], '9.2f')} {_fmt(r['p99_ms'], '9.2f')} {_fmt(r['ops_per_s'], '9.1f')} "
+                f"{_fmt(r['rows_per_s'], '11.0f')} {_fmt(r['peak_rss_mb'], '8.1f')}")
+        previous = base.get((r["scenario"], r["evaluations"]))
+        if previous:
+            line += f" {r['p50_ms'] / previous['p50_ms']:11.2f}x" if previous["p50_ms"] else ""
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scenario benchmarks against a local stub backend.")
+    parser.add_argument("--evaluations", type=int, nargs="+", default=[1000, 10000],
+                        help="dataset sizes to run (e.g. 1000 100000 1000000)")
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dataset", help="serve files written by benchmarks.dataset instead of generating")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=None)
+    parser.add_argument("--iterations", type=int, default=None, help="override per-scenario iteration counts")
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--upload-bytes", type=int, default=256 * 1024)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="earlier --json output to compare against")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-ctx", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return worker(args)
+
+    from benchmarks.stub_backend import start_stub_process
+
+    results = []
+    sizes = args.evaluations
+    if args.dataset:
+        from benchmarks.dataset import dataset_files, read_records
+        sizes = [sum(1 for _ in read_records(dataset_files(args.dataset)["evaluations"]))]
+    for n in sizes:
+        if args.dataset:
+            process, url = start_stub_process(dataset_dir=args.dataset)
+        else:
+            process, url = start_stub_process(n_jobs=args.jobs, n_resumes=args.resumes, n_evaluations=n,
+                                              seed=args.seed)
+        ctx = {"url": url, "evaluations": n, "page_size": args.page_size,
+               "concurrency": args.concurrency, "upload_bytes": args.upload_bytes}
+        try:
+            for name in args.scenarios or list(SCENARIOS):
+                print(f"running {name} with {n} evaluations...", file=sys.stderr, flush=True)
+                results.append(spawn(name, ctx, args.iterations))
+        finally:
+            process.terminate()
+            process.join()
+
+    print()
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print_table(results, baseline)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "argv": sys.argv[1:], "results": results},
+                      f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
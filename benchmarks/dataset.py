@@ -0,0 +1,233 @@
+# benchmarks/dataset.py
+# Usage: python -m benchmarks.dataset --out data/ [--evaluations 1000000] [--format jsonl|parquet] [--seed 42]
+import argparse
+import functools
+import gzip
+import itertools
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+SKILLS = [
+    "python", "sql", "java", "javascript", "typescript", "react", "node.js", "django", "flask",
+    "fastapi", "pandas", "numpy", "scikit-learn", "tensorflow", "pytorch", "machine learning",
+    "deep learning", "natural language processing", "computer vision", "statistics", "excel",
+    "power bi", "tableau", "docker", "kubernetes", "aws", "azure", "google cloud", "git", "linux",
+    "postgresql", "mongodb", "redis", "spark", "hadoop", "airflow", "rest api", "graphql",
+    "html", "css", "c++", "go", "rust", "data visualization", "etl", "communication",
+]
+TITLES = [
+    "Data Analyst", "Data Scientist", "Machine Learning Engineer", "Backend Developer",
+    "Frontend Developer", "Full Stack Developer", "DevOps Engineer", "Business Analyst",
+    "Software Engineer", "Cloud Engineer", "NLP Engineer", "BI Developer",
+]
+COMPANIES = [f"{a} {b}" for a in ("Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli")
+             for b in ("Labs", "Systems", "Analytics", "Technologies")]
+LOCATIONS = ["Hyderabad", "Bangalore", "Pune", "Delhi NCR", "Chennai", "Mumbai", "Remote"]
+DEGREES = ["B.Tech", "B.E.", "B.Sc", "BCA", "M.Tech", "MCA", "M.Sc"]
+FIRST = ["Aarav", "Vivaan", "Aditya", "Diya", "Ananya", "Ishaan", "Kavya", "Rohan", "Sneha", "Arjun",
+         "Meera", "Karthik", "Pooja", "Rahul", "Nisha", "Vikram", "Priya", "Siddharth", "Tara", "Neel"]
+LAST = ["Sharma", "Reddy", "Iyer", "Patel", "Gupta", "Nair", "Rao", "Singh", "Das", "Menon"]
+VERDICTS = ("High", "Medium", "Low")
+EPOCH = datetime(2025, 1, 1)
+# evaluations are spread over one placement season
+SEASON = timedelta(days=180)
+
+
+def _rng(seed, kind, i):
+    # per-record generator: record i is the same however the stream is sliced
+    return random.Random(f"{seed}:{kind}:{i}")
+
+
+def _timestamp(offset):
+    return (EPOCH + offset).isoformat(timespec="seconds")
+
+
+# -----------------------
+# Records
+# -----------------------
+def job_record(i, seed=0):
+    rng = _rng(seed, "job", i)
+    skills = rng.sample(SKILLS, rng.randint(6, 10))
+    must, nice, keywords = skills[:rng.randint(3, 5)], skills[5:8], skills[8:]
+    title = rng.choice(TITLES)
+    return {
+        "id": i,
+        "title": title,
+        "company": rng.choice(COMPANIES),
+        "location": rng.choice(LOCATIONS),
+        "description_text": (f"We are hiring a {title} to build and maintain data products. "
+                             f"Must have {', '.join(must)}. Nice to have {', '.join(nice) or 'none'}."),
+        "must_have_skills": must,
+        "good_to_have_skills": nice,
+        "keywords": keywords,
+        "is_active": rng.random() < 0.8,
+        "created_at": _timestamp(timedelta(days=rng.randint(0, 30))),
+    }
+
+
+def resume_record(i, seed=0):
+    rng = _rng(seed, "resume", i)
+    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+    return {
+        "id": i,
+        "user_id": i,
+        "student_name": name,
+        "email": f"{name.lower().replace(' ', '.')}{i}@example.com",
+        "file_path": f"uploads/resume_{i}.pdf",
+        "skills": rng.sample(SKILLS, rng.randint(4, 12)),
+        "education": [{"degree": rng.choice(DEGREES), "year": rng.randint(2022, 2026)}],
+        "experience": [{"role": "Intern", "months": rng.randint(0, 12)}] if rng.random() < 0.6 else [],
+        "created_at": _timestamp(timedelta(days=rng.randint(0, 60))),
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _job_skills(job_id, seed):
+    job = job_record(job_id, seed)
+    return tuple(job["must_have_skills"] + job["good_to_have_skills"])
+
+
+def evaluation_record(i, n_jobs, n_resumes, total, seed=0):
+    rng = _rng(seed, "evaluation", i)
+    job_id, resume_id = rng.randint(1, n_jobs), rng.randint(1, n_resumes)
+    wanted = _job_skills(job_id, seed)
+    missing = [s for s in wanted if rng.random() < 0.4]
+    hard = 100.0 * (len(wanted) - len(missing)) / len(wanted)
+    semantic = min(100.0, max(0.0, rng.gauss(55.0, 18.0)))
+    relevance = round(0.3 * hard + 0.7 * semantic, 2)
+    return {
+        "id": i,
+        "user_id": resume_id,
+        "resume_id": resume_id,
+        "job_id": job_id,
+        "relevance_score": relevance,
+        "hard_match_score": round(hard, 2),
+        "semantic_match_score": round(semantic, 2),
+        "verdict": VERDICTS[0] if relevance >= 70 else VERDICTS[1] if relevance >= 40 else VERDICTS[2],
+        "missing_skills": missing,
+        "suggestions": [f"Add evidence of {s} (projects, internships or certifications)." for s in missing[:3]],
+        # ids grow with time across the season, as a real table would
+        "created_at": _timestamp(SEASON * (i / max(total, 1)) + timedelta(seconds=rng.randint(0, 3600))),
+    }
+
+
+def iter_jobs(n, seed=0, start=1):
+    return (job_record(i, seed) for i in range(start, start + n))
+
+
+def iter_resumes(n, seed=0, start=1):
+    return (resume_record(i, seed) for i in range(start, start + n))
+
+
+def iter_evaluations(n, n_jobs, n_resumes, seed=0, start=1, total=None):
+    # pass the full size as total when generating in slices; it sets the timeline
+    total = total or start + n - 1
+    return (evaluation_record(i, n_jobs, n_resumes, total, seed) for i in range(start, start + n))
+
+
+# -----------------------
+# Writers / readers
+# -----------------------
+def _open(path, mode):
+    return gzip.open(path, mode + "t", encoding="utf-8") if path.endswith(".gz") else open(path, mode, encoding="utf-8")
+
+
+def write_jsonl(path, records):
+    """Stream records to JSON Lines (gzip when the name ends in .gz); returns the count."""
+    count = 0
+    with _open(path, "w") as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def write_parquet(path, records, batch_size=50_000):
+    """Stream records to Parquet one row group per batch; needs pyarrow."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    count, writer = 0, None
+    try:
+        while True:
+            batch = list(itertools.islice(records, batch_size))
+            if not batch:
+                break
+            if writer is None:
+                table = pa.Table.from_pylist(batch)
+                writer = pq.ParquetWriter(path, table.schema)
+            else:
+                table = pa.Table.from_pylist(batch, schema=writer.schema)
+            writer.write_table(table)
+            count += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def read_records(path, batch_size=50_000):
+    """Stream records back from a .jsonl(.gz) or .parquet file."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield from batch.to_pylist()
+        return
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def dataset_files(directory):
+    """{"jobs": path, "resumes": path, "evaluations": path} for whichever format was written."""
+    out = {}
+    for kind in ("jobs", "resumes", "evaluations"):
+        for ext in (".jsonl", ".jsonl.gz", ".parquet"):
+            path = os.path.join(directory, kind + ext)
+            if os.path.exists(path):
+                out[kind] = path
+                break
+    return out
+
+
+def load_dataset(directory):
+    """Materialize a generated dataset as the dict the stub backend serves."""
+    files = dataset_files(directory)
+    missing = {"jobs", "resumes", "evaluations"} - set(files)
+    if missing:
+        raise FileNotFoundError(f"{directory} has no {', '.join(sorted(missing))} file")
+    return {kind: list(read_records(path)) for kind, path in files.items()}
+
+
+def generate(directory, n_jobs=200, n_resumes=10_000, n_evaluations=100_000, seed=0, fmt="jsonl"):
+    os.makedirs(directory, exist_ok=True)
+    ext = {"jsonl": ".jsonl", "jsonl.gz": ".jsonl.gz", "parquet": ".parquet"}[fmt]
+    write = write_parquet if fmt == "parquet" else write_jsonl
+    streams = {
+        "jobs": iter_jobs(n_jobs, seed),
+        "resumes": iter_resumes(n_resumes, seed),
+        "evaluations": iter_evaluations(n_evaluations, n_jobs, n_resumes, seed),
+    }
+    return {kind: write(os.path.join(directory, kind + ext), records) for kind, records in streams.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic dataset for the stub backend.")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--resumes", type=int, default=10_000)
+    parser.add_argument("--evaluations", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["jsonl", "jsonl.gz", "parquet"], default="jsonl")
+    args = parser.parse_args()
+    counts = generate(args.out, args.jobs, args.resumes, args.evaluations, args.seed, args.format)
+    for kind, count in counts.items():
+        print(f"{kind:<12} {count:>10} records")
+
+
+if __name__ == "__main__":
+    main()
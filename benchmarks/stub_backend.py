@@ -0,0 +1,293 @@
+# benchmarks/stub_backend.py
+import hashlib
+import json
+import multiprocessing
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from benchmarks.dataset import iter_evaluations, iter_jobs, iter_resumes, load_dataset
+from utils.aggregates import summarize
+
+EVALUATION_JOB_SECONDS = 0.5
+
+
+# -----------------------
+# Synthetic data
+# -----------------------
+def make_dataset(n_jobs=20, n_resumes=50, n_evaluations=200, seed=0):
+    """In-memory dataset from the seeded generator in benchmarks/dataset.py."""
+    return {
+        "jobs": list(iter_jobs(n_jobs, seed)),
+        "resumes": list(iter_resumes(n_resumes, seed)),
+        "evaluations": list(iter_evaluations(n_evaluations, n_jobs, n_resumes, seed)),
+    }
+
+
+# -----------------------
+# Handler
+# -----------------------
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so clients can keep the connection open between requests
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # headers and body go out as separate writes; avoid Nagle/delayed-ACK stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.count_connection()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload, status=200, cache_key=None, source=None):
+        if cache_key is not None:
+            body, etag = self.server.encoded(cache_key, payload, source)
+        else:
+            body = json.dumps(payload).encode()
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _drain_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _route(self, method):
+        self.server.count_request()
+        path = urlparse(self.path).path.rstrip("/")
+        data = self.server.data
+        if method == "GET":
+            if path == "/health":
+                return self._send_json({"status": "healthy"})
+            if path in ("/jobs/jobs", "/admin/job-descriptions", "/job-descriptions"):
+                return self._send_json(data["jobs"], cache_key="jobs")
+            if path == "/resumes/resumes":
+                return self._send_json(data["resumes"], cache_key="resumes")
+            if path in ("/evaluations", "/admin/evaluations"):
+                query = parse_qs(urlparse(self.path).query)
+                if "since_id" in query or "updated_after" in query:
+                    return self._send_json(self._evaluation_delta(query))
+                if {"min_score", "max_score", "verdict"} & set(query):
+                    return self._send_json(self._filtered_page(query))
+                if "limit" in query:
+                    limit = int(query["limit"][0])
+                    offset = int(query.get("offset", ["0"])[0])
+                    # a fresh slice per request: version the cached body by the source list
+                    return self._send_json(data["evaluations"][offset:offset + limit],
+                                           cache_key=("evaluations", offset, limit), source=data["evaluations"])
+                return self._send_json(data["evaluations"], cache_key="evaluations")
+            if path == "/admin/users":
+                return self._send_json(data.get("users", data["resumes"]))
+            if path == "/admin/summary":
+                bins = int(parse_qs(urlparse(self.path).query).get("bins", ["10"])[0])
+                return self._send_json(summarize(data.get("users", data["resumes"]), data["evaluations"],
+                                                 data["jobs"], bins=bins))
+            if path.startswith("/users/") and path.endswith("/evaluations"):
+                user_id = int(path.split("/")[2])
+                return self._send_json([e for e in data["evaluations"] if e["user_id"] == user_id])
+            if path.startswith("/uploads/"):
+                upload = self.server.uploads.get(path.split("/")[2])
+                if upload is not None:
+                    return self._send_json({"received": upload["received"]})
+            if path.startswith("/evaluations/jobs/"):
+                job = self.server.evaluation_jobs.get(path.rsplit("/", 1)[1])
+                if job is not None:
+                    return self._send_json(self._job_status(job, urlparse(self.path).query))
+        elif method == "PUT":
+            body = self._drain_body()
+            if path.startswith("/uploads/"):
+                upload = self.server.uploads.get(path.split("/")[2])
+                if upload is not None:
+                    start = int(self.headers["Content-Range"].split()[1].split("-")[0])
+                    if start == upload["received"]:
+                        upload["received"] += len(body)
+                    return self._send_json({"received": upload["received"]})
+        elif method == "POST":
+            body = self._drain_body()
+            if path == "/upload-file":
+                return self._send_json(self._extraction(len(body)))
+            if path == "/uploads":
+                upload_id = str(len(self.server.uploads) + 1)
+                self.server.uploads[upload_id] = {"received": 0, "size": json.loads(body)["size"]}
+                return self._send_json({"upload_id": upload_id})
+            if path.startswith("/uploads/") and path.endswith("/complete"):
+                upload = self.server.uploads.get(path.split("/")[2])
+                if upload is not None and upload["received"] == upload["size"]:
+                    return self._send_json(self._extraction(upload["received"]))
+                return self._send_json({"detail": "Upload incomplete"}, status=409)
+            if path == "/evaluations/jobs":
+                job_id = str(len(self.server.evaluation_jobs) + 1)
+                self.server.evaluation_jobs[job_id] = {"started": time.monotonic(), "payload": json.loads(body)}
+                return self._send_json({"job_id": job_id, "status": "queued"}, status=202)
+            if path == "/evaluations":
+                return self._send_json(self._evaluation_result(json.loads(body)))
+            if path == "/evaluations/evaluation":
+                form = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+                rid, jid = int(form.get("resume_id", 0)), int(form.get("job_id", 0))
+                score = float((rid * 31 + jid * 17) % 100)
+                verdict = "High" if score >= 70 else "Medium" if score >= 40 else "Low"
+                return self._send_json({"status": "success", "data": {
+                    "resume_id": rid, "job_id": jid, "score": score, "verdict": verdict}})
+            if path in ("/token", "/auth/token"):
+                return self._send_json({"access_token": "stub-token", "token_type": "bearer",
+                                        "user_id": 1, "is_admin": True})
+        self._send_json({"detail": "Not Found"}, status=404)
+
+    def _extraction(self, size):
+        return {"extracted_text": f"stub extraction of {size} bytes", "word_count": size // 6}
+
+    def _evaluation_result(self, payload):
+        score = float(len(payload.get("resume_text", "")) % 100)
+        return {"relevance_score": score, "hard_match_score": score, "semantic_match_score": score,
+                "verdict": "High" if score >= 70 else "Medium" if score >= 40 else "Low",
+                "missing_skills": [], "suggestions": [], "created_at": "2026-01-01T00:00:00"}
+
+    def _filtered_page(self, query):
+        lo = float(query["min_score"][0]) if "min_score" in query else None
+        hi = float(query["max_score"][0]) if "max_score" in query else None
+        verdict = query.get("verdict", [None])[0]
+        rows = [e for e in self.server.data["evaluations"]
+                if (verdict is None or e.get("verdict") == verdict)
+                and (lo is None or (e.get("relevance_score") is not None and e["relevance_score"] >= lo))
+                and (hi is None or (e.get("relevance_score") is not None and e["relevance_score"] <= hi))]
+        if "limit" not in query:
+            return rows
+        offset = int(query.get("offset", ["0"])[0])
+        return rows[offset:offset + int(query["limit"][0])]
+
+    def _evaluation_delta(self, query):
+        since_id = int(query.get("since_id", ["0"])[0])
+        updated_after = query.get("updated_after", [""])[0]
+        evaluations = self.server.data["evaluations"]
+        items = [e for e in evaluations
+                 if e["id"] > since_id or (updated_after and e.get("updated_at", "") > updated_after)]
+        return {
+            "items": items,
+            "deleted_ids": list(self.server.deleted_ids),
+            "watermark": {"since_id": max([since_id] + [e["id"] for e in items])},
+        }
+
+    def _job_status(self, job, query):
+        wait = float(parse_qs(query).get("wait", ["0"])[0])
+        remaining = job["started"] + EVALUATION_JOB_SECONDS - time.monotonic()
+        if wait and remaining > 0:
+            time.sleep(min(wait, remaining))
+        progress = min(100.0, (time.monotonic() - job["started"]) / EVALUATION_JOB_SECONDS * 100)
+        if progress < 100:
+            return {"status": "running", "progress": progress}
+        return {"status": "completed", "progress": 100, "result": self._evaluation_result(job["payload"])}
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_PUT(self):
+        self._route("PUT")
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, data=None):
+        super().__init__(address, StubHandler)
+        self.data = data or make_dataset()
+        self.uploads = {}
+        self.deleted_ids = []  # evaluation tombstones served in delta responses
+        self.evaluation_jobs = {}
+        self.connections = 0
+        self.requests = 0
+        self._stats_lock = threading.Lock()
+        self._encoded = {}  # cache key -> (list version, body, etag)
+        self._encoded_lock = threading.Lock()
+
+    def encoded(self, key, payload, source=None):
+        """JSON body and ETag of a list payload, re-encoded only when the list changes.
+
+        Benchmarks request the same large lists over and over; encoding them
+        each time would measure the stub instead of the client. When payload
+        is derived from a larger list (a page), pass that list as `source`
+        and put the slice bounds in `key`.
+        """
+        # records are replaced, appended or removed, never edited in place
+        origin = payload if source is None else source
+        version = (id(origin), len(origin), id(origin[0]) if origin else None,
+                   id(origin[-1]) if origin else None)
+        with self._encoded_lock:
+            hit = self._encoded.get(key)
+            if hit is not None and hit[0] == version:
+                return hit[1], hit[2]
+        body = json.dumps(payload).encode()
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        with self._encoded_lock:
+            # room for every page of a large dataset plus the other lists
+            if len(self._encoded) >= 1024:
+                self._encoded.clear()
+            self._encoded[key] = (version, body, etag)
+        return body, etag
+
+    def count_connection(self):
+        with self._stats_lock:
+            self.connections += 1
+
+    def count_request(self):
+        with self._stats_lock:
+            self.requests += 1
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.connections = 0
+            self.requests = 0
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_stub(host="127.0.0.1", port=0, data=None):
+    server = StubServer((host, port), data=data)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _serve(host, port, dataset_dir, dataset, ready):
+    data = load_dataset(dataset_dir) if dataset_dir else make_dataset(**dataset)
+    server = StubServer((host, port), data=data)
+    ready.put(server.url)
+    server.serve_forever()
+
+
+def start_stub_process(host="127.0.0.1", port=0, dataset_dir=None, **dataset):
+    """Run the stub in a child process so it does not count towards the caller's CPU / RSS.
+
+    Serves the files written by benchmarks/dataset.py from dataset_dir,
+    or else a generated dataset (kwargs go to make_dataset()).
+    Returns (process, url).
+    """
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(host, port, dataset_dir, dataset, ready), daemon=True)
+    process.start()
+    return process, ready.get(timeout=600)
+
+
+if __name__ == "__main__":
+    # python -m benchmarks.stub_backend [dataset_dir]
+    import sys
+    server = StubServer(("127.0.0.1", 8000), data=load_dataset(sys.argv[1]) if len(sys.argv) > 1 else None)
+    print(f"Stub backend listening on {server.url}")
+    server.serve_forever()
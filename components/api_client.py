@@ -1,21 +1,248 @@
 # components/api_client.py
+import itertools
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from components import metrics, transport
+from components.cache import TTLCache
+from components.pagination import DEFAULT_PAGE_SIZE, iter_frames, iter_pages
+from components.singleflight import SingleFlight
+from components.sync import get_sync
 from dotenv import load_dotenv
+from utils.local_store import get_local_store
 
 load_dotenv()
 API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
 
+JOBS_PATH = "/jobs/jobs/"
+RESUMES_PATH = "/resumes/resumes/"
+EVALUATIONS_PATH = "/evaluations"
+
+# max concurrent evaluate() calls issued by evaluate_many()
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "8"))
+
+# -----------------------
+# Read cache
+# -----------------------
+# TTL in seconds per list endpoint; 0 disables caching for that endpoint
+CACHE_TTL = {
+    JOBS_PATH: float(os.getenv("CACHE_TTL_JOBS", "60")),
+    RESUMES_PATH: float(os.getenv("CACHE_TTL_RESUMES", "30")),
+    EVALUATIONS_PATH: float(os.getenv("CACHE_TTL_EVALUATIONS", "15")),
+}
+
+# stale entries are kept this long so they can be revalidated with ETag/Last-Modified
+CACHE_RETENTION = float(os.getenv("CACHE_RETENTION", "3600"))
+
+# typed local-store table for list endpoints queried locally (see utils/local_store.py);
+# the others are persisted only as raw responses
+STORE_TABLES = {
+    EVALUATIONS_PATH: "evaluations",
+}
+
+# module-level so every APIClient (i.e. every Streamlit session) shares it;
+# values are {"data", "etag", "last_modified", "size", "fresh_until", "version"}
+_cache = TTLCache(
+    maxsize=int(os.getenv("CACHE_MAX_ENTRIES", "256")),
+    max_bytes=int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+)
+
+# identical GETs in flight at the same time (e.g. many sessions opening a
+# page together) share one request and its decoded result
+_flight = SingleFlight()
+
+# url prefix -> number of times it was invalidated. A read remembers the
+# generation it started under: it neither joins a flight from an older
+# generation nor writes its result back once a write has invalidated it.
+_generations = {}
+_generation_lock = threading.RLock()
+
+
+# new for every payload the cache takes in; a 304 keeps the entry's version
+_versions = itertools.count(1)
+
+
+def _generation(url):
+    with _generation_lock:
+        return sum(n for prefix, n in _generations.items() if url.startswith(prefix))
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def cache_stats():
+    return _cache.stats()
+
+
+def revalidation_stats():
+    stats = {}
+    for path in CACHE_TTL:
+        # same endpoint label the HTTP and cache counters use
+        endpoint = metrics.endpoint_of(f"{API_BASE.rstrip('/')}{path}")
+        sent = metrics.get("conditional_requests", endpoint)
+        hits = metrics.get("not_modified", endpoint)
+        stats[path] = {
+            "conditional_requests": int(sent),
+            "not_modified": int(hits),
+            "hit_rate": hits / sent if sent else 0.0,
+            "bytes_saved": int(metrics.get("bytes_saved", endpoint)),
+            "stale_served": int(metrics.get("stale_served", endpoint)),
+            "coalesced": int(metrics.get("coalesced", endpoint)),
+        }
+    return stats
+
+
+# -----------------------
+# Batch helpers
+# -----------------------
+def evaluation_score(item):
+    """Score of an evaluate_many() item; failed items sort last."""
+    result = item.get("result") if item.get("ok") else None
+    if isinstance(result, dict):
+        data = result.get("data", result)
+        for key in ("score", "relevance_score"):
+            if isinstance(data, dict) and data.get(key) is not None:
+                return float(data[key])
+    return float("-inf")
+
+
+def flatten_batch_results(results):
+    """One flat row per evaluate_many() item, ready for a DataFrame."""
+    rows = []
+    for item in results:
+        result = item.get("result") if isinstance(item.get("result"), dict) else {}
+        data = result.get("data", result) if isinstance(result.get("data", result), dict) else {}
+        score = evaluation_score(item)
+        rows.append({
+            "resume_id": item["resume_id"],
+            "job_id": item["job_id"],
+            "score": score if item["ok"] and score != float("-inf") else None,
+            "verdict": data.get("verdict"),
+            "error": item["error"],
+        })
+    return rows
+
+
 class APIClient:
     def __init__(self):
         self.base = API_BASE.rstrip("/")
 
+    def _cached_get(self, path):
+        url = f"{self.base}{path}"
+        entry = _cache.get(url)
+        if entry is not None and entry["fresh_until"] > time.monotonic():
+            metrics.incr("cache_hits", metrics.endpoint_of(url))
+            return entry["data"]
+        metrics.incr("cache_misses", metrics.endpoint_of(url))
+        generation = _generation(url)
+        return self._coalesced(url, lambda: self._fetch(path, url, generation), generation)
+
+    def _coalesced(self, url, fn, generation=None):
+        if generation is None:
+            generation = _generation(url)
+        data, shared = _flight.do((url, generation), fn)
+        if shared:
+            metrics.incr("coalesced", metrics.endpoint_of(url))
+        return data
+
+    def _fetch(self, path, url, generation):
+        entry = _cache.get(url)
+        if entry is not None and entry["fresh_until"] > time.monotonic():
+            # refreshed by a request that finished just before this one started
+            return entry["data"]
+        store = get_local_store()
+        if entry is None and store is not None:
+            entry = self._warm_entry(store, url)
+
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        endpoint = metrics.endpoint_of(url)
+        if headers:
+            metrics.incr("conditional_requests", endpoint)
+
+        try:
+            r = transport.get(url, headers=headers)
+        except requests.RequestException:
+            # backend down or circuit open: fall back to the last copy we have
+            if entry is None:
+                raise
+            return self._serve_stale(url, entry)
+        if r.status_code >= 500 and entry is not None:
+            return self._serve_stale(url, entry)
+        if r.status_code == 304 and entry is not None:
+            # unchanged: reuse the already decoded payload, no JSON parse
+            metrics.incr("not_modified", endpoint)
+            metrics.incr("bytes_saved", endpoint, entry["size"])
+            with _generation_lock:
+                if _generation(url) == generation:
+                    _cache.set(url, dict(entry, fresh_until=time.monotonic() + CACHE_TTL[path]),
+                               CACHE_RETENTION, size=entry["size"])
+            return entry["data"]
+        if not r.ok:
+            return []
+
+        data = r.json()
+        with _generation_lock:
+            if _generation(url) != generation:
+                # a write landed while this request was in flight: don't cache what may predate it
+                return data
+            if store is not None:
+                store.save_response(url, r.text, r.headers.get("ETag"), r.headers.get("Last-Modified"))
+                if path in STORE_TABLES:
+                    store.replace_records(STORE_TABLES[path], data)
+            _cache.set(url, {
+                "data": data,
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "size": len(r.content),
+                "fresh_until": time.monotonic() + CACHE_TTL[path],
+                "version": next(_versions),
+            }, CACHE_RETENTION, size=len(r.content))
+        return data
+
+    def _warm_entry(self, store, url):
+        # persisted by an earlier process: stale, so it is revalidated (or, without
+        # validators, refetched) before use and served only if the backend fails
+        saved = store.load_response(url)
+        if saved is None:
+            return None
+        return {
+            "data": json.loads(saved["body"]),
+            "etag": saved["etag"],
+            "last_modified": saved["last_modified"],
+            "size": len(saved["body"]),
+            "fresh_until": 0.0,
+            "version": next(_versions),
+        }
+
+    def _serve_stale(self, url, entry):
+        metrics.incr("stale_served", metrics.endpoint_of(url))
+        return entry["data"]
+
+    def _invalidate(self, *paths):
+        store = get_local_store()
+        with _generation_lock:
+            for path in paths:
+                prefix = f"{self.base}{path}"
+                _generations[prefix] = _generations.get(prefix, 0) + 1
+                _cache.invalidate_prefix(prefix)
+                if store is not None:
+                    store.invalidate_prefix(prefix)
+
     # -----------------------
     # Health
     # -----------------------
-    def health(self):
+    def health(self, timeout=5):
         try:
-            r = requests.get(f"{self.base}/health", timeout=5)
+            r = transport.get(f"{self.base}/health", timeout=timeout)
             return r.json()
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -24,49 +251,57 @@ class APIClient:
     # Jobs
     # -----------------------
     def create_job(self, payload: dict):
-        return requests.post(f"{self.base}/jobs/jobs/", json=payload).json()
+        r = transport.post(f"{self.base}{JOBS_PATH}", json=payload)
+        self._invalidate(JOBS_PATH)
+        return r.json()
 
     def get_jobs(self):
-        r = requests.get(f"{self.base}/jobs/jobs/")
-        return r.json() if r.ok else []
+        return self._cached_get(JOBS_PATH)
 
     def get_job(self, job_id: int):
-        r = requests.get(f"{self.base}/jobs/jobs/{job_id}")
-        return r.json()
+        url = f"{self.base}{JOBS_PATH}{job_id}"
+        return self._coalesced(url, lambda: transport.get(url).json())
 
     def update_job(self, job_id: int, payload: dict):
-        r = requests.put(f"{self.base}/jobs/jobs/{job_id}", json=payload)
+        r = transport.put(f"{self.base}{JOBS_PATH}{job_id}", json=payload)
+        self._invalidate(JOBS_PATH)
         return r.json()
 
     def delete_job(self, job_id: int):
-        r = requests.delete(f"{self.base}/jobs/jobs/{job_id}")
+        r = transport.delete(f"{self.base}{JOBS_PATH}{job_id}")
+        # evaluations of a deleted job may be removed with it
+        self._invalidate(JOBS_PATH, EVALUATIONS_PATH)
         return r.json()
 
     # -----------------------
     # Resumes
     # -----------------------
     def create_resume(self, payload: dict):
-        r = requests.post(f"{self.base}/resumes/resumes/", json=payload)
+        r = transport.post(f"{self.base}{RESUMES_PATH}", json=payload)
+        self._invalidate(RESUMES_PATH)
         return r.json()
 
     def get_resumes(self):
-        r = requests.get(f"{self.base}/resumes/resumes/")
-        return r.json() if r.ok else []
+        return self._cached_get(RESUMES_PATH)
 
     def get_resume(self, resume_id: int):
-        r = requests.get(f"{self.base}/resumes/resumes/{resume_id}")
-        return r.json()
+        url = f"{self.base}{RESUMES_PATH}{resume_id}"
+        return self._coalesced(url, lambda: transport.get(url).json())
 
     def update_resume(self, resume_id: int, payload: dict):
-        r = requests.put(f"{self.base}/resumes/resumes/{resume_id}", json=payload)
+        r = transport.put(f"{self.base}{RESUMES_PATH}{resume_id}", json=payload)
+        self._invalidate(RESUMES_PATH)
         return r.json()
 
     def delete_resume(self, resume_id: int):
-        r = requests.delete(f"{self.base}/resumes/resumes/{resume_id}")
+        r = transport.delete(f"{self.base}{RESUMES_PATH}{resume_id}")
+        self._invalidate(RESUMES_PATH, EVALUATIONS_PATH)
         return r.json()
 
     def parse_resume(self, resume_id: int):
-        r = requests.post(f"{self.base}/resumes/resumes/{resume_id}/parse")
+        r = transport.post(f"{self.base}{RESUMES_PATH}{resume_id}/parse")
+        # parsing fills in skills/education on the stored resume
+        self._invalidate(RESUMES_PATH)
         return r.json()
 
     # -----------------------
@@ -75,9 +310,162 @@ class APIClient:
     def evaluate(self, resume_id: int, job_id: int):
         # backend expects form data
         data = {"resume_id": resume_id, "job_id": job_id}
-        r = requests.post(f"{self.base}/evaluations/evaluation/", data=data)
+        r = transport.post(f"{self.base}/evaluations/evaluation/", data=data)
+        self._invalidate(EVALUATIONS_PATH)
         return r.json() if r.ok else {"status": "error", "message": r.text}
 
     def get_evaluations(self):
-        r = requests.get(f"{self.base}/evaluations")
-        return r.json() if r.ok else []
+        return self._cached_get(EVALUATIONS_PATH)
+
+    def sync_evaluations(self):
+        """Evaluations kept in a local store refreshed with since_id / updated_after deltas."""
+        def fetch(params):
+            r = transport.get(f"{self.base}{EVALUATIONS_PATH}", params=params)
+            return r.json() if r.ok else None
+        sync = get_sync(f"{self.base}{EVALUATIONS_PATH}")
+        store = get_local_store()
+        if store is not None and not sync.synced:
+            sync.seed(store.load_records("evaluations"))
+        delta = sync.pull(fetch)
+        if store is not None and delta:
+            if delta.full:
+                store.replace_records("evaluations", delta.upserts)
+            else:
+                store.delete_records("evaluations", delta.deleted_ids)
+                store.upsert_records("evaluations", delta.upserts)
+        return sync.items()
+
+    def query_evaluations(self, min_score=None, max_score=None, verdict=None,
+                          user_id=None, job_id=None, limit=None):
+        """Filtered evaluations; indexed SQLite query when the local store is enabled."""
+        return self.query_evaluations_keyed(min_score, max_score, verdict, user_id, job_id, limit)[0]
+
+    def query_evaluations_keyed(self, min_score=None, max_score=None, verdict=None,
+                                user_id=None, job_id=None, limit=None):
+        """query_evaluations() plus its evaluation_frame() key: (url, filters, sync version)."""
+        url = f"{self.base}{EVALUATIONS_PATH}"
+        records = self.sync_evaluations()
+        # read before querying, so the rows are never older than the key says
+        key = (url, (min_score, max_score, verdict, user_id, job_id, limit), get_sync(url).version)
+        store = get_local_store()
+        if store is not None:
+            return store.query_evaluations(min_score, max_score, verdict, user_id, job_id, limit), key
+        out = []
+        for e in records:
+            score = e.get("relevance_score")
+            if (min_score is not None or max_score is not None) and score is None:
+                continue
+            if min_score is not None and score < min_score:
+                continue
+            if max_score is not None and score > max_score:
+                continue
+            if any(value is not None and e.get(key) != value
+                   for key, value in (("verdict", verdict), ("user_id", user_id), ("job_id", job_id))):
+                continue
+            out.append(e)
+            if limit and len(out) >= limit:
+                break
+        return out, key
+
+    def evaluate_many(self, pairs, max_workers=BATCH_MAX_WORKERS, on_progress=None):
+        """Evaluate (resume_id, job_id) pairs with bounded concurrency.
+
+        Returns one dict per pair, in input order, with keys resume_id,
+        job_id, ok, result and error; a failing pair never aborts the batch.
+        on_progress(done, total, item) is called on the caller's thread.
+        """
+        pairs = list(pairs)
+        results = [None] * len(pairs)
+        if not pairs:
+            return results
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as pool:
+            futures = {pool.submit(self.evaluate, rid, jid): i for i, (rid, jid) in enumerate(pairs)}
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                rid, jid = pairs[i]
+                item = {"resume_id": rid, "job_id": jid, "ok": False, "result": None, "error": None}
+                try:
+                    result = future.result()
+                    item["result"] = result
+                    if isinstance(result, dict) and result.get("status") == "error":
+                        item["error"] = result.get("message")
+                    else:
+                        item["ok"] = True
+                except Exception as e:
+                    item["error"] = str(e)
+                results[i] = item
+                if on_progress:
+                    on_progress(done, len(pairs), item)
+        return results
+
+    def rank_resumes_for_job(self, job_id: int, resume_ids, **kwargs):
+        results = self.evaluate_many([(rid, job_id) for rid in resume_ids], **kwargs)
+        return sorted(results, key=evaluation_score, reverse=True)
+
+    def match_resume_to_jobs(self, resume_id: int, job_ids, **kwargs):
+        results = self.evaluate_many([(resume_id, jid) for jid in job_ids], **kwargs)
+        return sorted(results, key=evaluation_score, reverse=True)
+
+    def cached_evaluations(self):
+        """The evaluations list while the read cache holds it fresh, else None; never sends a request."""
+        url = f"{self.base}{EVALUATIONS_PATH}"
+        entry = _cache.get(url)
+        if entry is not None and entry["fresh_until"] > time.monotonic():
+            metrics.incr("cache_hits", metrics.endpoint_of(url))
+            return entry["data"]
+        return None
+
+    def frame_key(self, records):
+        """evaluation_frame() key for a list from get_evaluations() / cached_evaluations().
+
+        (url, entry version) while the read cache still holds exactly these
+        records, else None (e.g. a stale copy served while the backend is down).
+        """
+        url = f"{self.base}{EVALUATIONS_PATH}"
+        entry = _cache.get(url)
+        if entry is not None and entry["data"] is records:
+            return url, entry["version"]
+        return None
+
+    def iter_evaluation_pages(self, page_size=DEFAULT_PAGE_SIZE, cursor=None, cache=False):
+        """Evaluations page by page, uncached by default.
+
+        With cache=True a complete, error-free walk from the first page is
+        stored under the /evaluations read-cache key, so the next rerun is
+        answered by get_evaluations() / cached_evaluations().
+        """
+        url = f"{self.base}{EVALUATIONS_PATH}"
+        generation = _generation(url)
+        walk = {"ok": True, "bytes": 0}
+
+        def fetch(params):
+            r = transport.get(url, params=params)
+            walk["ok"] = walk["ok"] and r.ok
+            walk["bytes"] += len(r.content)
+            return r.json() if r.ok else []
+
+        pages = iter_pages(fetch, page_size, cursor)
+        if not cache or cursor is not None:
+            return pages
+        return self._caching_pages(url, pages, generation, walk)
+
+    def _caching_pages(self, url, pages, generation, walk):
+        records = []
+        for page in pages:
+            records.extend(page)
+            yield page
+        with _generation_lock:
+            if walk["ok"] and _generation(url) == generation:
+                _cache.set(url, {
+                    "data": records,
+                    "etag": None,
+                    "last_modified": None,
+                    "size": walk["bytes"],
+                    "fresh_until": time.monotonic() + CACHE_TTL[EVALUATIONS_PATH],
+                    "version": next(_versions),
+                }, CACHE_RETENTION, size=walk["bytes"])
+
+    def iter_evaluation_frames(self, page_size=DEFAULT_PAGE_SIZE, columns=None, cache=False):
+        # pandas-backed; imported here so the client itself stays light
+        from utils.evaluations import to_frame
+        return iter_frames(self.iter_evaluation_pages(page_size, cache=cache), columns, frame_factory=to_frame)
@@ -0,0 +1,96 @@
+# components/async_client.py
+import asyncio
+import inspect
+from components.api_client import APIClient
+
+
+# -----------------------
+# Concurrent fan-out
+# -----------------------
+def _as_awaitable(call):
+    if inspect.isawaitable(call):
+        return call
+    # plain callable: run the blocking client call on a worker thread
+    return asyncio.to_thread(call)
+
+
+async def gather_named(calls: dict):
+    names = list(calls)
+    results = await asyncio.gather(*(_as_awaitable(c) for c in calls.values()),
+                                   return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return dict(zip(names, results))
+
+
+def fetch_concurrently(**calls):
+    """Run independent reads at once from synchronous (Streamlit) code.
+
+    Each keyword is a coroutine or a zero-argument callable; returns
+    {keyword: result}. Latency is roughly that of the slowest call.
+    """
+    return asyncio.run(gather_named(calls))
+
+
+# -----------------------
+# Async API client
+# -----------------------
+class AsyncAPIClient:
+    """asyncio counterpart of APIClient.
+
+    Calls run on worker threads over the shared pooled session, so the
+    read cache and connection pool are the same as for the sync client.
+    """
+
+    def __init__(self, client: APIClient = None):
+        self.client = client or APIClient()
+
+    async def _run(self, fn, *args):
+        return await asyncio.to_thread(fn, *args)
+
+    # Health
+    async def health(self):
+        return await self._run(self.client.health)
+
+    # Jobs
+    async def create_job(self, payload: dict):
+        return await self._run(self.client.create_job, payload)
+
+    async def get_jobs(self):
+        return await self._run(self.client.get_jobs)
+
+    async def get_job(self, job_id: int):
+        return await self._run(self.client.get_job, job_id)
+
+    async def update_job(self, job_id: int, payload: dict):
+        return await self._run(self.client.update_job, job_id, payload)
+
+    async def delete_job(self, job_id: int):
+        return await self._run(self.client.delete_job, job_id)
+
+    # Resumes
+    async def create_resume(self, payload: dict):
+        return await self._run(self.client.create_resume, payload)
+
+    async def get_resumes(self):
+        return await self._run(self.client.get_resumes)
+
+    async def get_resume(self, resume_id: int):
+        return await self._run(self.client.get_resume, resume_id)
+
+    async def update_resume(self, resume_id: int, payload: dict):
+        return await self._run(self.client.update_resume, resume_id, payload)
+
+    async def delete_resume(self, resume_id: int):
+        return await self._run(self.client.delete_resume, resume_id)
+
+    async def parse_resume(self, resume_id: int):
+        return await self._run(self.client.parse_resume, resume_id)
+
+    # Evaluations
+    async def evaluate(self, resume_id: int, job_id: int):
+        return await self._run(self.client.evaluate, resume_id, job_id)
+
+    async def get_evaluations(self):
+        return await self._run(self.client.get_evaluations)
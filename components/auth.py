@@ -1,6 +1,6 @@
 # components/auth.py
 import os
-import requests
+from components import transport
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -21,7 +21,7 @@ class AuthClient:
                 "password": password,
                 "grant_type": "password"
             }
-            response = requests.post(f"{self.base}/auth/token", data=form_data)
+            response = transport.post(f"{self.base}/auth/token", data=form_data)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -34,7 +34,7 @@ class AuthClient:
     # -----------------------
     def register(self, user_data):
         try:
-            response = requests.post(f"{self.base}/auth/register", json=user_data)
+            response = transport.post(f"{self.base}/auth/register", json=user_data)
             return response.status_code == 200
         except Exception as e:
             st.error(f"Registration error: {str(e)}")
@@ -45,7 +45,7 @@ class AuthClient:
     # -----------------------
     def reset_password(self, email):
         try:
-            response = requests.post(f"{self.base}/auth/forgot-password", json={"email": email})
+            response = transport.post(f"{self.base}/auth/forgot-password", json={"email": email})
             return response.status_code == 200
         except Exception as e:
             st.error(f"Password reset error: {str(e)}")
@@ -0,0 +1,134 @@
+# components/evaluation_jobs.py
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from components import transport
+from dotenv import load_dotenv
+
+load_dotenv()
+EVALUATION_JOBS_PATH = "/evaluations/jobs"
+# used when the backend has no job queue: evaluations run on these threads instead,
+# one pool per owner (Streamlit session) so one student's queue never delays another's
+LOCAL_WORKERS = int(os.getenv("EVALUATION_LOCAL_WORKERS", "4"))
+LOCAL_JOB_RETENTION = 3600
+# read timeout for the full synchronous evaluation, the slowest call in the app; POST is never retried
+EVALUATION_READ_TIMEOUT = float(os.getenv("EVALUATION_TIMEOUT", "120"))
+
+_executors = {}   # owner -> (last_used, executor)
+_local_jobs = {}  # id -> (submitted_at, future, owner)
+_lock = threading.Lock()
+
+
+# -----------------------
+# Submit
+# -----------------------
+def submit(base_url, evaluation_data, headers=None, owner=None):
+    """Queue an evaluation and return a handle {"id", "remote"} without waiting for it.
+
+    Backend protocol:
+        POST {base}/evaluations/jobs       -> {"job_id": ...}
+        GET  {base}/evaluations/jobs/{id}  -> {"status", "progress", "result", "error"}
+    If the backend does not offer it, the synchronous POST /evaluations
+    runs on a background thread behind the same handle interface; `owner`
+    (e.g. the session) picks the worker pool it queues on.
+    """
+    r = transport.post(f"{base_url}{EVALUATION_JOBS_PATH}", json=evaluation_data, headers=headers)
+    if r.status_code in (200, 201, 202):
+        return {"id": r.json()["job_id"], "remote": True}
+    if r.status_code in (404, 405):
+        return _submit_local(base_url, evaluation_data, headers, owner)
+    return None
+
+
+def evaluation_timeout():
+    """(connect, read) for a synchronous evaluation, honouring transport.configure()."""
+    return (transport.default_timeout()[0], EVALUATION_READ_TIMEOUT)
+
+
+def _run_sync(base_url, evaluation_data, headers):
+    r = transport.post(f"{base_url}/evaluations", json=evaluation_data, headers=headers,
+                       timeout=evaluation_timeout())
+    r.raise_for_status()
+    return r.json()
+
+
+def _submit_local(base_url, evaluation_data, headers, owner):
+    job_id = f"local-{uuid.uuid4().hex}"
+    now = time.time()
+    with _lock:
+        # forget finished jobs nobody came back for
+        for stale in [k for k, (t, f, _) in _local_jobs.items() if f.done() and now - t > LOCAL_JOB_RETENTION]:
+            del _local_jobs[stale]
+        _prune_executors(now)
+        _, executor = _executors.get(owner) or (now, None)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=LOCAL_WORKERS, thread_name_prefix="evaluation")
+        _executors[owner] = (now, executor)
+        future = executor.submit(_run_sync, base_url, evaluation_data, headers)
+        _local_jobs[job_id] = (now, future, owner)
+    return {"id": job_id, "remote": False}
+
+
+def _prune_executors(now):
+    # shut down pools of owners (sessions) that have been idle for a while; called under _lock
+    busy = {owner for _, f, owner in _local_jobs.values() if not f.done()}
+    for owner, (last_used, executor) in list(_executors.items()):
+        if owner not in busy and now - last_used > LOCAL_JOB_RETENTION:
+            executor.shutdown(wait=False)
+            del _executors[owner]
+
+
+# -----------------------
+# Poll
+# -----------------------
+def status(base_url, handle, headers=None, wait=0):
+    """Current state of a submitted evaluation.
+
+    Returns {"status": queued|running|completed|failed, "progress": 0-100
+    or None, "result", "error"}. wait > 0 long-polls for up to that many
+    seconds.
+    """
+    if handle["remote"]:
+        return _remote_status(base_url, handle["id"], headers, wait)
+    return _local_status(handle["id"], wait)
+
+
+def _remote_status(base_url, job_id, headers, wait):
+    params = {"wait": wait} if wait else {}
+    connect, read = transport.default_timeout()
+    timeout = (connect, read + wait)
+    r = transport.get(f"{base_url}{EVALUATION_JOBS_PATH}/{job_id}", headers=headers,
+                      params=params, timeout=timeout)
+    if r.status_code == 404:
+        return {"status": "failed", "progress": None, "result": None, "error": "Evaluation job not found"}
+    if not r.ok:
+        # transient: report as still running and let the caller poll again
+        return {"status": "running", "progress": None, "result": None, "error": None}
+    body = r.json()
+    return {
+        "status": body.get("status", "running"),
+        "progress": body.get("progress"),
+        "result": body.get("result"),
+        "error": body.get("error"),
+    }
+
+
+def _local_status(job_id, wait):
+    with _lock:
+        entry = _local_jobs.get(job_id)
+    if entry is None:
+        return {"status": "failed", "progress": None, "result": None, "error": "Evaluation job not found"}
+    future = entry[1]
+    if wait and not future.done():
+        wait_futures([future], timeout=wait)
+    if not future.done():
+        return {"status": "running" if future.running() else "queued",
+                "progress": None, "result": None, "error": None}
+    with _lock:
+        _local_jobs.pop(job_id, None)
+    try:
+        return {"status": "completed", "progress": 100, "result": future.result(), "error": None}
+    except Exception as e:
+        return {"status": "failed", "progress": None, "result": None, "error": str(e)}
@@ -0,0 +1,147 @@
+# components/export.py
+import csv
+import importlib.util
+import io
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+# rows per API page while exporting; also the Parquet row-group size
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", "5000"))
+
+EXPORT_COLUMNS = ["id", "user_id", "job_id", "relevance_score", "hard_match_score", "semantic_match_score",
+                  "verdict", "missing_skills", "suggestions", "created_at"]
+LIST_COLUMNS = ("missing_skills", "suggestions")
+# format -> (file extension, mime type)
+EXPORT_FORMATS = {
+    "csv": (".csv", "text/csv"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+
+# -----------------------
+# Filtering
+# -----------------------
+def _matches(record, min_score, max_score, verdict):
+    if verdict is not None and record.get("verdict") != verdict:
+        return False
+    if min_score is None and max_score is None:
+        return True
+    try:
+        score = float(record.get("relevance_score"))
+    except (TypeError, ValueError):
+        # any score bound excludes unscored rows, as in EvaluationIndex.query
+        return False
+    return (min_score is None or score >= min_score) and (max_score is None or score <= max_score)
+
+
+def server_filters(min_score=None, max_score=None, verdict=None):
+    """Query parameters asking the backend to filter; unset bounds are left out."""
+    params = {"min_score": min_score, "max_score": max_score, "verdict": verdict}
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def filter_pages(pages, min_score=None, max_score=None, verdict=None):
+    """Apply the candidates-tab filters page by page (min <= score <= max, verdict).
+
+    A no-op on pages the backend already filtered; it only matters for
+    servers that ignore the server_filters() parameters.
+    """
+    for page in pages:
+        if min_score is not None or max_score is not None or verdict is not None:
+            page = [r for r in page if _matches(r, min_score, max_score, verdict)]
+        if page:
+            yield page
+
+
+# -----------------------
+# Writers
+# -----------------------
+def write_csv(pages, out, columns=EXPORT_COLUMNS):
+    """Stream pages of records to a binary file as UTF-8 CSV; returns the row count.
+
+    List columns are joined with "; " so every row stays one line.
+    """
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+    writer = csv.DictWriter(text, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for page in pages:
+        for record in page:
+            row = dict(record)
+            for col in LIST_COLUMNS:
+                if isinstance(row.get(col), list):
+                    row[col] = "; ".join(map(str, row[col]))
+            writer.writerow(row)
+        count += len(page)
+    text.flush()
+    text.detach()  # leave `out` open for the caller
+    return count
+
+
+def parquet_schema(columns=EXPORT_COLUMNS):
+    import pyarrow as pa
+
+    types = {
+        "id": pa.int64(), "user_id": pa.int64(), "job_id": pa.int64(),
+        "relevance_score": pa.float64(), "hard_match_score": pa.float64(), "semantic_match_score": pa.float64(),
+        "verdict": pa.string(), "missing_skills": pa.list_(pa.string()), "suggestions": pa.list_(pa.string()),
+        "created_at": pa.string(),
+    }
+    return pa.schema([(col, types.get(col, pa.string())) for col in columns])
+
+
+def write_parquet(pages, out, columns=EXPORT_COLUMNS):
+    """Stream pages of records to Parquet, one row group per page; returns the row count.
+
+    The schema is fixed up front, so pages with missing fields or only
+    nulls still line up. Needs pyarrow.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = parquet_schema(columns)
+    count = 0
+    with pq.ParquetWriter(out, schema) as writer:
+        for page in pages:
+            writer.write_table(pa.Table.from_pylist(page, schema=schema))
+            count += len(page)
+    return count
+
+
+WRITERS = {"csv": write_csv, "parquet": write_parquet}
+
+
+def export_records(pages, out, fmt="csv", columns=EXPORT_COLUMNS):
+    """Write record pages to the binary file `out` in `fmt`; returns the row count.
+
+    Only one page is held at a time, so writing to a file on disk keeps
+    memory bounded by the page size.
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"unknown export format {fmt!r}; expected one of {', '.join(WRITERS)}")
+    return WRITERS[fmt](pages, out, columns)
+
+
+def export_buffer(pages, fmt="csv", columns=EXPORT_COLUMNS):
+    """Finished export in a BytesIO, for st.download_button's deferred `data` callable.
+
+    Streamlit takes the buffer's value without another copy, so the
+    encoded file is held once and the rows never are.
+    """
+    out = io.BytesIO()
+    export_records(pages, out, fmt, columns)
+    return out
+
+
+def available_formats():
+    """Export formats usable here; Parquet needs the optional pyarrow package."""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != "parquet" or importlib.util.find_spec("pyarrow")]
+
+
+def export_file_name(prefix, fmt):
+    return prefix + EXPORT_FORMATS[fmt][0]
+
+
+def export_mime(fmt):
+    return EXPORT_FORMATS[fmt][1]
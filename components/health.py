@@ -0,0 +1,129 @@
+# components/health.py
+import os
+import threading
+import time
+from collections import deque
+from dotenv import load_dotenv
+from components.resilience import get_breaker
+
+load_dotenv()
+# seconds between background probes
+HEALTH_INTERVAL = float(os.getenv("HEALTH_INTERVAL", "15"))
+HEALTH_TIMEOUT = float(os.getenv("HEALTH_TIMEOUT", "5"))
+# number of probe results kept for the history
+HEALTH_HISTORY = int(os.getenv("HEALTH_HISTORY", "50"))
+
+
+class HealthMonitor:
+    """Probe the backend on a daemon thread and keep the latest result.
+
+    Pages read snapshot() instead of calling /health themselves, so a slow
+    or unreachable backend never blocks a rerun. probe() returns the
+    decoded /health payload and is expected not to raise.
+    """
+
+    def __init__(self, probe, interval=HEALTH_INTERVAL, history=HEALTH_HISTORY, breaker=None):
+        self.probe = probe
+        self.breaker = breaker  # CircuitBreaker of the probed host, reported in snapshot()
+        self.interval = interval
+        self.history = deque(maxlen=history)  # {"at", "ok", "latency", "error"}
+        self.status = None
+        self.checked_at = None
+        self.latency = None
+        self.error = None
+        self.consecutive_failures = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # -----------------------
+    # Lifecycle
+    # -----------------------
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="health-monitor", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def refresh(self):
+        """Ask for a probe now without waiting for it."""
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.check()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def check(self):
+        start = time.perf_counter()
+        try:
+            status = self.probe()
+        except Exception as e:
+            status = {"status": "error", "message": str(e)}
+        latency = time.perf_counter() - start
+        ok = isinstance(status, dict) and status.get("status") == "healthy"
+        error = None if ok else (status.get("message") if isinstance(status, dict) else None) or str(status)
+        with self._lock:
+            self.status = status
+            self.checked_at = time.time()
+            self.latency = latency
+            self.error = error
+            self.consecutive_failures = 0 if ok else self.consecutive_failures + 1
+            self.history.append({"at": self.checked_at, "ok": ok, "latency": latency, "error": error})
+        return status
+
+    # -----------------------
+    # State
+    # -----------------------
+    @property
+    def healthy(self):
+        """True / False after the first probe, None before it."""
+        with self._lock:
+            if self.status is None:
+                return None
+            return self.status.get("status") == "healthy" if isinstance(self.status, dict) else False
+
+    def snapshot(self):
+        healthy = self.healthy
+        with self._lock:
+            return {
+                "healthy": healthy,
+                "status": self.status,
+                "latency": self.latency,
+                "checked_at": self.checked_at,
+                "age": time.time() - self.checked_at if self.checked_at else None,
+                "error": self.error,
+                "consecutive_failures": self.consecutive_failures,
+                "errors": [h for h in self.history if not h["ok"]],
+                "history": list(self.history),
+                "breaker": self.breaker.snapshot() if self.breaker is not None else None,
+            }
+
+
+# -----------------------
+# Shared instance
+# -----------------------
+_monitor = None
+_monitor_lock = threading.Lock()
+
+
+def get_health_monitor():
+    """Process-wide monitor for API_BASE_URL, started on first use."""
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                from components.api_client import APIClient
+                client = APIClient()
+                _monitor = HealthMonitor(lambda: client.health(timeout=HEALTH_TIMEOUT),
+                                         breaker=get_breaker(client.base))
+                _monitor.start()
+    return _monitor
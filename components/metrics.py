@@ -0,0 +1,227 @@
+# components/metrics.py
+import math
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+from dotenv import load_dotenv
+
+load_dotenv()
+# serve Prometheus text on http://0.0.0.0:METRICS_PORT/metrics (0 = off)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+# or rewrite this file every METRICS_INTERVAL seconds (empty = off)
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_INTERVAL = float(os.getenv("METRICS_INTERVAL", "15"))
+METRICS_PREFIX = "resume_app_"
+
+# upper bounds in seconds; Prometheus adds +Inf
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# (metric name, endpoint, extra labels) -> value; process-wide, shared by all clients
+_counters = defaultdict(float)
+# (metric name, endpoint) -> {"buckets", "counts", "sum", "count"}
+_histograms = {}
+_lock = threading.Lock()
+
+
+def _labels(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# -----------------------
+# Counters
+# -----------------------
+def incr(name, endpoint="", value=1, **labels):
+    with _lock:
+        _counters[(name, endpoint, _labels(labels))] += value
+
+
+def get(name, endpoint="", **labels):
+    with _lock:
+        return _counters.get((name, endpoint, _labels(labels)), 0)
+
+
+def total(name, endpoint=""):
+    """Sum of a counter over all its extra labels."""
+    with _lock:
+        return sum(v for (n, e, _), v in _counters.items() if n == name and e == endpoint)
+
+
+def by_label(name, endpoint, label):
+    """{label value: count} of a counter for one endpoint, e.g. status codes."""
+    out = defaultdict(float)
+    with _lock:
+        for (n, e, labels), value in _counters.items():
+            if n == name and e == endpoint:
+                out[dict(labels).get(label, "")] += value
+    return dict(out)
+
+
+def snapshot():
+    """Return {name: {endpoint: value}} for every recorded counter, summed over extra labels."""
+    with _lock:
+        out = defaultdict(lambda: defaultdict(float))
+        for (name, endpoint, _), value in _counters.items():
+            out[name][endpoint] += value
+        return {name: dict(values) for name, values in out.items()}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+# -----------------------
+# Histograms
+# -----------------------
+def observe(name, endpoint="", value=0.0, buckets=LATENCY_BUCKETS):
+    with _lock:
+        h = _histograms.get((name, endpoint))
+        if h is None:
+            h = _histograms[(name, endpoint)] = {
+                "buckets": buckets, "counts": [0] * (len(buckets) + 1), "sum": 0.0, "count": 0,
+            }
+        i = next((k for k, bound in enumerate(h["buckets"]) if value <= bound), len(h["buckets"]))
+        h["counts"][i] += 1
+        h["sum"] += value
+        h["count"] += 1
+
+
+def histogram(name, endpoint=""):
+    with _lock:
+        h = _histograms.get((name, endpoint))
+        return None if h is None else dict(h, counts=list(h["counts"]))
+
+
+def endpoints(name):
+    with _lock:
+        names = {e for (n, e) in _histograms if n == name}
+        names.update(e for (n, e, _) in _counters if n == name)
+    return sorted(names)
+
+
+def quantile(name, endpoint, q):
+    """Estimate the q-quantile by linear interpolation inside the matching bucket."""
+    h = histogram(name, endpoint)
+    if not h or not h["count"]:
+        return None
+    rank = q * h["count"]
+    seen = 0
+    for i, count in enumerate(h["counts"]):
+        if count and seen + count >= rank:
+            lower = h["buckets"][i - 1] if i else 0.0
+            if i == len(h["buckets"]):
+                return lower  # beyond the last bound: report the bound
+            return lower + (h["buckets"][i] - lower) * (rank - seen) / count
+        seen += count
+    return h["buckets"][-1]
+
+
+# -----------------------
+# Labels
+# -----------------------
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f-]{27}|[0-9a-f]{24,})$", re.I)
+
+
+def endpoint_of(url):
+    """URL -> path with ids collapsed (/jobs/jobs/42 -> /jobs/jobs/{id}) to bound label cardinality."""
+    path = urlsplit(url).path or "/"
+    return "/".join("{id}" if _ID_SEGMENT.match(part) else part for part in path.split("/"))
+
+
+# -----------------------
+# Prometheus export
+# -----------------------
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(pairs):
+    pairs = [(k, v) for k, v in pairs if v != ""]
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}" if pairs else ""
+
+
+def _fmt_value(value):
+    return "+Inf" if value == math.inf else repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def to_prometheus(prefix=METRICS_PREFIX):
+    """All counters and histograms in the Prometheus text exposition format."""
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted((k, dict(h, counts=list(h["counts"]))) for k, h in _histograms.items())
+    lines = []
+    current = None
+    for (name, endpoint, labels), value in counters:
+        metric = f"{prefix}{name}" if name.endswith("_total") else f"{prefix}{name}_total"
+        if metric != current:
+            lines.append(f"# TYPE {metric} counter")
+            current = metric
+        lines.append(f"{metric}{_fmt_labels((('endpoint', endpoint),) + labels)} {_fmt_value(value)}")
+    current = None
+    for (name, endpoint), h in histograms:
+        metric = f"{prefix}{name}"
+        if metric != current:
+            lines.append(f"# TYPE {metric} histogram")
+            current = metric
+        cumulative = 0
+        for bound, count in zip(list(h["buckets"]) + [math.inf], h["counts"]):
+            cumulative += count
+            lines.append(f"{metric}_bucket{_fmt_labels((('endpoint', endpoint), ('le', _fmt_value(bound))))} {cumulative}")
+        lines.append(f"{metric}_sum{_fmt_labels((('endpoint', endpoint),))} {h['sum']!r}")
+        lines.append(f"{metric}_count{_fmt_labels((('endpoint', endpoint),))} {h['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    # write-then-rename so a scraper never reads a half-written file
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(to_prometheus())
+    os.replace(tmp, path)
+
+
+_exporter_started = False
+
+
+def start_exporter(port=METRICS_PORT, path=METRICS_FILE, interval=METRICS_INTERVAL):
+    """Start the configured exporters once per process; no-op when neither is set."""
+    global _exporter_started
+    with _lock:
+        if _exporter_started or not (port or path):
+            return
+        _exporter_started = True
+
+    if port:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+
+    if path:
+        def run():
+            while True:
+                try:
+                    write_prometheus(path)
+                except OSError:
+                    pass
+                time.sleep(interval)
+        threading.Thread(target=run, name="metrics-file", daemon=True).start()
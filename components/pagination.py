@@ -0,0 +1,84 @@
+# components/pagination.py
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def _page_items(payload):
+    """Split a page response into (items, next_cursor)."""
+    if isinstance(payload, list):
+        return payload, None
+    if isinstance(payload, dict):
+        items = payload.get("items", payload.get("data"))
+        if isinstance(items, list):
+            return items, payload.get("next_cursor")
+    return [], None
+
+
+def iter_pages(fetch, page_size=DEFAULT_PAGE_SIZE, cursor=None, params=None):
+    """Lazily yield lists of records from a paginated list endpoint.
+
+    fetch(params) must return the decoded JSON body. Supports both
+    cursor envelopes ({"items": [...], "next_cursor": ...}) and plain
+    limit/offset lists. A backend that ignores paging and returns the
+    whole table is still sliced into pages of page_size.
+    """
+    base = dict(params or {})
+    offset = 0
+    previous_first = None
+    while True:
+        query = dict(base, limit=page_size)
+        if cursor is not None:
+            query["cursor"] = cursor
+        else:
+            query["offset"] = offset
+        items, next_cursor = _page_items(fetch(query))
+
+        if len(items) > page_size:
+            # paging not supported upstream: slice what we got and stop
+            for start in range(0, len(items), page_size):
+                yield items[start:start + page_size]
+            return
+        if items and items[0] == previous_first:
+            # same page served again: offset is being ignored
+            return
+        if items:
+            previous_first = items[0]
+            yield items
+        if next_cursor is not None:
+            cursor = next_cursor
+            continue
+        if cursor is not None or len(items) < page_size:
+            return
+        offset += len(items)
+
+
+def iter_frames(pages, columns=None, frame_factory=None):
+    """Turn an iterator of record pages into DataFrame chunks."""
+    import pandas as pd
+
+    make_frame = frame_factory or pd.DataFrame.from_records
+    for page in pages:
+        df = make_frame(page)
+        if columns is not None:
+            df = df.reindex(columns=columns)
+        yield df
+
+
+def show_frames_progressively(placeholder, frames, **dataframe_kwargs):
+    """Render the first chunk at once, then re-render as rows double.
+
+    Returns the total number of rows shown.
+    """
+    import pandas as pd
+
+    shown, rendered_at, chunks = 0, 0, []
+    for df in frames:
+        chunks.append(df)
+        shown += len(df)
+        if rendered_at == 0 or shown >= 2 * rendered_at:
+            chunks = [pd.concat(chunks, ignore_index=True)]
+            placeholder.dataframe(chunks[0], **dataframe_kwargs)
+            rendered_at = shown
+    if chunks and shown != rendered_at:
+        placeholder.dataframe(pd.concat(chunks, ignore_index=True), **dataframe_kwargs)
+    return shown
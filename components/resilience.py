@@ -0,0 +1,218 @@
+# components/resilience.py
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import requests
+from dotenv import load_dotenv
+from components import metrics
+
+load_dotenv()
+
+# -----------------------
+# Config
+# -----------------------
+# extra attempts for idempotent requests (GET/HEAD/OPTIONS/PUT/DELETE); POST is never retried
+RETRY_ATTEMPTS = int(os.getenv("HTTP_RETRIES", "2"))
+BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.2"))
+BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "5"))
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# consecutive failures (connection errors, timeouts, 5xx) that open a host's breaker
+BREAKER_FAILURES = int(os.getenv("BREAKER_FAILURES", "5"))
+# seconds an open breaker fails fast before letting one trial request through
+BREAKER_RESET = float(os.getenv("BREAKER_RESET", "30"))
+
+
+def _parse_timeouts(raw):
+    """"/health=5,/evaluations/evaluation=120" -> {"/health": 5.0, ...}"""
+    out = {}
+    for part in raw.split(","):
+        if "=" in part:
+            path, seconds = part.split("=", 1)
+            out[path.strip()] = float(seconds)
+    return out
+
+
+# read timeout (seconds) per path fragment; the longest matching fragment wins
+ENDPOINT_TIMEOUTS = {
+    "/health": 5.0,
+    "/evaluations/evaluation": 120.0,
+    "/upload-file": 120.0,
+    "/uploads": 120.0,
+    "/parse": 60.0,
+}
+ENDPOINT_TIMEOUTS.update(_parse_timeouts(os.getenv("HTTP_ENDPOINT_TIMEOUTS", "")))
+
+
+def timeout_for(url):
+    """Read timeout configured for the URL's endpoint, or None for the transport default."""
+    path = urlsplit(url).path
+    matches = [p for p in ENDPOINT_TIMEOUTS if p in path]
+    return ENDPOINT_TIMEOUTS[max(matches, key=len)] if matches else None
+
+
+# -----------------------
+# Retry policy
+# -----------------------
+def is_retryable(method, kwargs):
+    if method.upper() not in IDEMPOTENT_METHODS:
+        return False
+    # a streamed body cannot be sent twice
+    data = kwargs.get("data")
+    return data is None or isinstance(data, (bytes, bytearray, memoryview, str, dict, list, tuple))
+
+
+def backoff(attempt):
+    """Full-jitter exponential backoff for the given 0-based retry."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def retry_after(response):
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(0.0, min(BACKOFF_MAX, seconds))
+
+
+# -----------------------
+# Circuit breaker
+# -----------------------
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the host's breaker is open."""
+
+
+class CircuitBreaker:
+    """closed -> open after `failures` consecutive failures; open -> half_open
+    after `reset_timeout`, when a single trial request decides between
+    closed (success) and open again (failure)."""
+
+    def __init__(self, name, failures=BREAKER_FAILURES, reset_timeout=BREAKER_RESET):
+        self.name = name
+        self.failure_threshold = failures
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self.last_error = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"circuit open for {self.name}: {self.last_error}")
+                self.state = "half_open"
+                self._trial = False
+            if self.state == "half_open":
+                if self._trial:
+                    raise CircuitOpenError(f"circuit half-open for {self.name}, trial in flight")
+                self._trial = True
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial = False
+
+    def record_failure(self, error):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)
+            self._trial = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def release_trial(self):
+        """Free a half-open trial slot without counting a success or a failure."""
+        with self._lock:
+            self._trial = False
+
+    def snapshot(self):
+        with self._lock:
+            retry_in = None
+            if self.state == "open":
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "last_error": self.last_error,
+                "retry_in": retry_in,
+            }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(url):
+    """Process-wide breaker per scheme://host:port."""
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(key)
+        return breaker
+
+
+def breaker_states():
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.snapshot() for b in breakers}
+
+
+# -----------------------
+# Policy
+# -----------------------
+def send(method, url, do_request, retryable):
+    """Run do_request() under the host's breaker, retrying transient failures when retryable."""
+    breaker = get_breaker(url)
+    attempts = RETRY_ATTEMPTS + 1 if retryable else 1
+    for attempt in range(attempts):
+        try:
+            breaker.before_request()
+        except CircuitOpenError:
+            metrics.incr("breaker_rejections", metrics.endpoint_of(url))
+            raise
+        if attempt:
+            metrics.incr("http_retries", metrics.endpoint_of(url))
+        last = attempt == attempts - 1
+        try:
+            response = do_request()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            breaker.record_failure(e)
+            if last:
+                raise
+            delay = backoff(attempt)
+        except requests.exceptions.RequestException as e:
+            # not transient, but still a transport failure; settles a half-open trial
+            breaker.record_failure(e)
+            raise
+        except Exception:
+            # a local bug says nothing about the host, but must not hold the half-open trial
+            breaker.release_trial()
+            raise
+        else:
+            if response.status_code >= 500:
+                breaker.record_failure(f"HTTP {response.status_code}")
+            else:
+                breaker.record_success()
+            if last or response.status_code not in RETRY_STATUSES:
+                return response
+            delay = retry_after(response)
+            delay = backoff(attempt) if delay is None else delay
+            response.close()
+        time.sleep(delay)
@@ -0,0 +1,145 @@
+# components/sync.py
+import threading
+
+
+class Delta:
+    def __init__(self, upserts, deleted_ids, full):
+        self.upserts = upserts
+        self.deleted_ids = deleted_ids
+        self.full = full  # True when the response replaced everything
+
+    def __bool__(self):
+        return bool(self.full or self.upserts or self.deleted_ids)
+
+
+class DeltaSync:
+    """Keep a local copy of a list endpoint current using id / timestamp watermarks.
+
+    The first pull (or any pull the backend answers with a plain list) is
+    a full snapshot. Later pulls send since_id and updated_after; a
+    backend that supports deltas answers with an envelope:
+        {"items": [...], "deleted_ids": [...], "next_cursor": ..., "watermark": {...}}
+    Items carrying "deleted": true are tombstones as well.
+    """
+
+    def __init__(self, keep_records=True):
+        self.keep_records = keep_records
+        self.records = {}   # id -> record (when keep_records)
+        self.since_id = None
+        self.updated_after = None
+        self.version = 0
+        self._list = []
+        self._lock = threading.Lock()
+
+    @property
+    def synced(self):
+        return self.since_id is not None
+
+    def reset(self):
+        with self._lock:
+            self.records.clear()
+            self.since_id = self.updated_after = None
+            self._list = []
+            self.version += 1
+
+    def advance(self, max_id=None, max_updated=None):
+        """Move the watermark forward, e.g. after loading data some other way."""
+        if max_id is not None and (self.since_id is None or max_id > self.since_id):
+            self.since_id = max_id
+        if max_updated and (self.updated_after is None or str(max_updated) > self.updated_after):
+            self.updated_after = str(max_updated)
+
+    def seed(self, records):
+        """Warm start from records persisted earlier; the next pull is a delta."""
+        with self._lock:
+            if self.synced:
+                return
+            if self.keep_records:
+                self.records = {r["id"]: r for r in records}
+            self.observe(records)
+            self.version += 1
+            self._list = None
+
+    def observe(self, records):
+        for r in records:
+            self.advance(r.get("id"), r.get("updated_at") or r.get("created_at"))
+
+    def pull(self, fetch):
+        """Fetch and apply changes; fetch(params) returns decoded JSON or None on error."""
+        with self._lock:
+            params = {}
+            if self.synced:
+                params["since_id"] = self.since_id
+                if self.updated_after:
+                    params["updated_after"] = self.updated_after
+
+            payload = fetch(params)
+            if payload is None:
+                return Delta([], [], full=False)
+            if not isinstance(payload, dict) or ("items" not in payload and "deleted_ids" not in payload):
+                # plain list: the backend sent the whole table
+                items = payload if isinstance(payload, list) else []
+                if isinstance(payload, dict) and payload.get("status") == "success":
+                    items = payload.get("data", [])
+                return self._apply(items, [], full=True)
+
+            upserts, deleted = [], list(payload.get("deleted_ids") or [])
+            while True:
+                for r in payload.get("items") or []:
+                    if r.get("deleted"):
+                        deleted.append(r["id"])
+                    else:
+                        upserts.append(r)
+                cursor = payload.get("next_cursor")
+                if not cursor:
+                    break
+                payload = fetch(dict(params, cursor=cursor))
+                if payload is None:
+                    # partial delta: apply what we have, the watermark resumes from it
+                    payload = {}
+                    break
+                deleted.extend(payload.get("deleted_ids") or [])
+            watermark = payload.get("watermark") or {}
+            delta = self._apply(upserts, deleted, full=False)
+            self.advance(watermark.get("since_id"), watermark.get("updated_after"))
+            return delta
+
+    def _apply(self, upserts, deleted, full):
+        if full:
+            self.since_id = self.updated_after = None
+            if self.keep_records:
+                self.records = {}
+        if self.keep_records:
+            for rid in deleted:
+                self.records.pop(rid, None)
+            for r in upserts:
+                self.records[r["id"]] = r
+        self.observe(upserts)
+        delta = Delta(upserts, deleted, full)
+        if delta:
+            self.version += 1
+            self._list = None
+        return delta
+
+    def items(self):
+        """Current records ordered by id; the same list object until the data changes."""
+        with self._lock:
+            if self._list is None:
+                self._list = [self.records[k] for k in sorted(self.records)]
+            return self._list
+
+
+# -----------------------
+# Shared instances
+# -----------------------
+_syncs = {}
+_syncs_lock = threading.Lock()
+
+
+def get_sync(key, keep_records=True):
+    """Process-wide DeltaSync per key (e.g. endpoint URL)."""
+    with _syncs_lock:
+        sync = _syncs.get(key)
+        if sync is None:
+            sync = _syncs[key] = DeltaSync(keep_records)
+        return sync
@@ -0,0 +1,203 @@
+# components/transport.py
+import os
+import socket
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from dotenv import load_dotenv
+from components import metrics, resilience
+from utils.rerun_profiler import count_api_call
+
+load_dotenv()
+
+# -----------------------
+# Config
+# -----------------------
+# pool_connections = number of per-host pools kept alive,
+# pool_maxsize = max open connections per host
+POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+POOL_BLOCK = os.getenv("HTTP_POOL_BLOCK", "false").lower() in ("1", "true", "yes")
+KEEP_ALIVE = os.getenv("HTTP_KEEP_ALIVE", "true").lower() in ("1", "true", "yes")
+CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter with a default timeout and TCP keep-alive on pooled sockets."""
+
+    def __init__(self, timeout=None, keep_alive=True, **kwargs):
+        # must be set before super().__init__, which builds the pool manager
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keep_alive:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+# -----------------------
+# Shared session
+# -----------------------
+_settings = {
+    "pool_connections": POOL_CONNECTIONS,
+    "pool_maxsize": POOL_MAXSIZE,
+    "pool_block": POOL_BLOCK,
+    "keep_alive": KEEP_ALIVE,
+    "timeout": (CONNECT_TIMEOUT, READ_TIMEOUT),
+}
+_session = None
+_lock = threading.Lock()
+
+
+def _build_session():
+    session = requests.Session()
+    adapter = PooledAdapter(
+        timeout=_settings["timeout"],
+        keep_alive=_settings["keep_alive"],
+        pool_connections=_settings["pool_connections"],
+        pool_maxsize=_settings["pool_maxsize"],
+        pool_block=_settings["pool_block"],
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not _settings["keep_alive"]:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def get_session():
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def configure(pool_connections=None, pool_maxsize=None, pool_block=None,
+              keep_alive=None, timeout=None):
+    """Change pool settings; the shared session is rebuilt on next use."""
+    global _session
+    updates = {
+        "pool_connections": pool_connections,
+        "pool_maxsize": pool_maxsize,
+        "pool_block": pool_block,
+        "keep_alive": keep_alive,
+        "timeout": timeout,
+    }
+    with _lock:
+        _settings.update({k: v for k, v in updates.items() if v is not None})
+        old, _session = _session, None
+    if old is not None:
+        old.close()
+
+
+def default_timeout():
+    """(connect, read) timeout currently configured for the shared session."""
+    timeout = _settings["timeout"]
+    return tuple(timeout) if isinstance(timeout, (tuple, list)) else (timeout, timeout)
+
+
+def close():
+    global _session
+    with _lock:
+        old, _session = _session, None
+    if old is not None:
+        old.close()
+
+
+# -----------------------
+# Request helpers
+# -----------------------
+def request(method, url, **kwargs):
+    """Send through the shared session with per-endpoint timeouts, retries and the circuit breaker."""
+    if kwargs.get("timeout") is None:
+        read_timeout = resilience.timeout_for(url)
+        if read_timeout is not None:
+            kwargs["timeout"] = (default_timeout()[0], read_timeout)
+    endpoint = metrics.endpoint_of(url)
+    count_api_call()
+    start = time.perf_counter()
+    try:
+        response = resilience.send(method, url, lambda: get_session().request(method, url, **kwargs),
+                                   retryable=resilience.is_retryable(method, kwargs))
+    except Exception as e:
+        metrics.observe("http_request_duration_seconds", endpoint, time.perf_counter() - start)
+        metrics.incr("http_errors", endpoint, method=method, error=type(e).__name__)
+        raise
+    metrics.observe("http_request_duration_seconds", endpoint, time.perf_counter() - start)
+    metrics.incr("http_requests", endpoint, method=method, status=response.status_code)
+    metrics.incr("http_bytes_out", endpoint, int(response.request.headers.get("Content-Length") or 0))
+    if kwargs.get("stream"):
+        metrics.incr("http_bytes_in", endpoint, int(response.headers.get("Content-Length") or 0))
+    else:
+        metrics.incr("http_bytes_in", endpoint, len(response.content))
+    _time_json(response, endpoint)
+    return response
+
+
+def _time_json(response, endpoint):
+    # every client decodes with response.json(); time it where it happens
+    decode = response.json
+
+    def json(**kwargs):
+        start = time.perf_counter()
+        try:
+            return decode(**kwargs)
+        finally:
+            metrics.observe("json_decode_seconds", endpoint, time.perf_counter() - start)
+
+    response.json = json
+
+
+def http_report():
+    """One row per endpoint: request count, errors, latency percentiles, bytes, decode time, cache hits."""
+    rows = []
+    for endpoint in metrics.endpoints("http_request_duration_seconds"):
+        latency = metrics.histogram("http_request_duration_seconds", endpoint)
+        decode = metrics.histogram("json_decode_seconds", endpoint)
+        hits, misses = metrics.total("cache_hits", endpoint), metrics.total("cache_misses", endpoint)
+        rows.append({
+            "endpoint": endpoint,
+            "requests": int(metrics.total("http_requests", endpoint)),
+            "errors": int(metrics.total("http_errors", endpoint)),
+            "statuses": ", ".join(f"{code}×{int(n)}" for code, n in
+                                  sorted(metrics.by_label("http_requests", endpoint, "status").items())),
+            "retries": int(metrics.total("http_retries", endpoint)),
+            "p50_ms": (metrics.quantile("http_request_duration_seconds", endpoint, 0.5) or 0.0) * 1000.0,
+            "p95_ms": (metrics.quantile("http_request_duration_seconds", endpoint, 0.95) or 0.0) * 1000.0,
+            "mean_ms": latency["sum"] / latency["count"] * 1000.0 if latency["count"] else 0.0,
+            "bytes_in": int(metrics.total("http_bytes_in", endpoint)),
+            "bytes_out": int(metrics.total("http_bytes_out", endpoint)),
+            "json_ms": decode["sum"] / decode["count"] * 1000.0 if decode and decode["count"] else 0.0,
+            "cache_hit_rate": hits / (hits + misses) if hits + misses else None,
+        })
+    return rows
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def put(url, **kwargs):
+    return request("PUT", url, **kwargs)
+
+
+def delete(url, **kwargs):
+    return request("DELETE", url, **kwargs)
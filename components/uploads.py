@@ -0,0 +1,151 @@
+# components/uploads.py
+import itertools
+import os
+import uuid
+import requests
+from components import transport
+from dotenv import load_dotenv
+
+load_dotenv()
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+# files at least this large use the resumable chunked protocol when the backend offers it
+CHUNKED_UPLOAD_THRESHOLD = int(os.getenv("CHUNKED_UPLOAD_THRESHOLD", str(8 * 1024 * 1024)))
+UPLOAD_MAX_RETRIES = int(os.getenv("UPLOAD_MAX_RETRIES", "3"))
+
+
+class ChunkedUploadUnsupported(Exception):
+    pass
+
+
+# -----------------------
+# Zero-copy file access
+# -----------------------
+def file_size(file):
+    size = getattr(file, "size", None)
+    if isinstance(size, int):
+        return size
+    pos = file.tell()
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    file.seek(pos)
+    return size
+
+
+def iter_chunks(file, start=0, chunk_size=UPLOAD_CHUNK_SIZE):
+    """Yield the file from `start` in chunks.
+
+    In-memory uploads (BytesIO / Streamlit UploadedFile) yield memoryview
+    slices of the existing buffer, so nothing is copied; other file
+    objects are read chunk by chunk.
+    """
+    if hasattr(file, "getbuffer"):
+        view = file.getbuffer()
+        try:
+            for offset in range(start, view.nbytes, chunk_size):
+                yield view[offset:offset + chunk_size]
+        finally:
+            view.release()
+    else:
+        file.seek(start)
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+class SizedStream:
+    """Re-iterable request body of known length.
+
+    requests sends it with a Content-Length header (not chunked
+    transfer encoding) and hands each part straight to the socket.
+    """
+
+    def __init__(self, parts, length):
+        self.parts = parts  # zero-argument callable returning an iterator
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.parts())
+
+
+def multipart_body(file, filename, content_type=None, field="file"):
+    boundary = uuid.uuid4().hex
+    safe_name = (filename or "upload").replace('"', "%22").replace("\r", "").replace("\n", "")
+    head = (f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{safe_name}"\r\n'
+            f"Content-Type: {content_type or 'application/octet-stream'}\r\n\r\n").encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    length = len(head) + file_size(file) + len(tail)
+    body = SizedStream(lambda: itertools.chain((head,), iter_chunks(file), (tail,)), length)
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+# -----------------------
+# Upload paths
+# -----------------------
+def stream_upload(url, file, headers=None):
+    body, content_type = multipart_body(file, getattr(file, "name", None), getattr(file, "type", None))
+    headers = dict(headers or {}, **{"Content-Type": content_type})
+    return transport.post(url, data=body, headers=headers)
+
+
+def chunked_upload(base_url, file, headers=None, chunk_size=UPLOAD_CHUNK_SIZE):
+    """Resumable upload: init, PUT byte ranges, complete.
+
+    POST {base}/uploads                 -> {"upload_id": ...}
+    PUT  {base}/uploads/{id}            Content-Range: bytes a-b/total
+    GET  {base}/uploads/{id}            -> {"received": n}  (resume point)
+    POST {base}/uploads/{id}/complete   -> same body as /upload-file
+
+    Raises ChunkedUploadUnsupported if the backend has no /uploads route.
+    """
+    headers = dict(headers or {})
+    total = file_size(file)
+    init = transport.post(f"{base_url}/uploads", headers=headers, json={
+        "filename": getattr(file, "name", None),
+        "content_type": getattr(file, "type", None),
+        "size": total,
+    })
+    if init.status_code in (404, 405):
+        raise ChunkedUploadUnsupported(init.status_code)
+    init.raise_for_status()
+    upload_url = f"{base_url}/uploads/{init.json()['upload_id']}"
+
+    offset, failures = 0, 0
+    while offset < total:
+        try:
+            for chunk in iter_chunks(file, offset, chunk_size):
+                end = offset + len(chunk) - 1
+                r = transport.put(upload_url, data=chunk, headers=dict(
+                    headers, **{"Content-Range": f"bytes {offset}-{end}/{total}",
+                                "Content-Type": "application/octet-stream"}))
+                r.raise_for_status()
+                offset = end + 1
+                failures = 0
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError):
+            failures += 1
+            if failures > UPLOAD_MAX_RETRIES:
+                raise
+            # ask the server how much it actually has and continue from there
+            status = transport.get(upload_url, headers=headers)
+            status.raise_for_status()
+            offset = int(status.json().get("received", 0))
+    return transport.post(f"{upload_url}/complete", headers=headers)
+
+
+def upload_file(base_url, file, headers=None):
+    """Upload a resume to the extraction endpoint without buffering it again.
+
+    Large files go through chunked_upload when supported, everything
+    else (and the fallback) is a streamed multipart POST to /upload-file.
+    """
+    if file_size(file) >= CHUNKED_UPLOAD_THRESHOLD:
+        try:
+            return chunked_upload(base_url, file, headers)
+        except ChunkedUploadUnsupported:
+            pass
+    return stream_upload(f"{base_url}/upload-file", file, headers)
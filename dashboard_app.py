@@ -1,17 +1,32 @@
 # dashboard_app.py
+from utils.import_profiler import get_import_profiler, show_report
+get_import_profiler()  # before anything else, so the report covers the app's imports
 import os
 import time
+import asyncio
 import requests
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 from dotenv import load_dotenv
+from components import export, metrics, transport
+from components.async_client import fetch_concurrently
+from components.pagination import DEFAULT_PAGE_SIZE, iter_frames, iter_pages, show_frames_progressively
+from components.sync import get_sync
+from utils.aggregates import DEFAULT_BINS, summarize
+from utils.evaluation_index import EVALUATION_INDEX_TTL, EvaluationIndex, peek_index, store_index
+from utils.evaluations import TABLE_COLUMNS, to_frame
+from utils import rerun_profiler
+from utils.lazy import lazy_import
+
+# heavy; loaded on first use so the login screen starts without them
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
 
 # -----------------------
 # Config
 # -----------------------
 load_dotenv()
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
+metrics.start_exporter()
 
 st.set_page_config(
     page_title="Innomatics - Placement Dashboard",
@@ -77,29 +92,89 @@ class DashboardAPI:
     # Auth
     def login(self, email, password):
         form_data = {"username": email, "password": password, "grant_type": "password"}
-        r = requests.post(f"{self.base_url}/token", data=form_data)
+        r = transport.post(f"{self.base_url}/token", data=form_data)
         return self._handle(r)
 
+    def _get(self, path, params=None):
+        return transport.get(f"{self.base_url}{path}", headers=self._headers(), params=params or {})
+
     # Users
     def get_all_users(self):
-        r = requests.get(f"{self.base_url}/admin/users", headers=self._headers())
-        return self._handle(r) or []
+        return self._handle(self._get("/admin/users")) or []
 
     # Evaluations
     def get_evaluations(self, filters=None):
-        r = requests.get(f"{self.base_url}/admin/evaluations", headers=self._headers(), params=filters or {})
-        return self._handle(r) or []
+        return self._handle(self._get("/admin/evaluations", filters)) or []
+
+    def evaluation_sync(self):
+        # rows live in the candidates index; the sync only tracks watermarks
+        return get_sync(f"{self.base_url}/admin/evaluations", keep_records=False)
+
+    def pull_evaluation_changes(self):
+        return self.evaluation_sync().pull(lambda params: self._handle(self._get("/admin/evaluations", params)))
+
+    def iter_evaluation_pages(self, filters=None, page_size=DEFAULT_PAGE_SIZE, cursor=None):
+        def fetch(params):
+            return self._handle(self._get("/admin/evaluations", params)) or []
+        return iter_pages(fetch, page_size, cursor, params=filters)
+
+    def iter_evaluation_frames(self, filters=None, page_size=DEFAULT_PAGE_SIZE, columns=None):
+        return iter_frames(self.iter_evaluation_pages(filters, page_size), columns, frame_factory=to_frame)
+
+    def iter_export_pages(self, filters=None, page_size=export.EXPORT_PAGE_SIZE):
+        # runs on the download thread, where st.* calls in _handle are ignored: raise instead
+        def fetch(params):
+            r = self._get("/admin/evaluations", params)
+            r.raise_for_status()
+            return r.json()
+        return iter_pages(fetch, page_size, params=filters)
+
+    # Aggregates
+    def get_summary(self, bins=DEFAULT_BINS):
+        """Server-side overview numbers, or None when the backend has no summary endpoint."""
+        r = self._get("/admin/summary", {"bins": bins})
+        if r.status_code in (404, 405):
+            return None
+        return self._handle(r)
 
     # Jobs
     def get_job_descriptions(self, active_only=False):
         params = {"active_only": active_only} if active_only else {}
-        r = requests.get(f"{self.base_url}/admin/job-descriptions", headers=self._headers(), params=params)
-        return self._handle(r) or []
+        return self._handle(self._get("/admin/job-descriptions", params)) or []
 
     def create_job_description(self, jd_data):
-        r = requests.post(f"{self.base_url}/admin/job-descriptions", headers=self._headers(), json=jd_data)
+        r = transport.post(f"{self.base_url}/admin/job-descriptions", headers=self._headers(), json=jd_data)
         return self._handle(r)
 
+class AsyncDashboardAPI:
+    """asyncio counterpart of DashboardAPI.
+
+    Requests run on worker threads; responses are handled back on the
+    script thread so st.error / st.rerun in _handle keep working.
+    """
+
+    def __init__(self, api: DashboardAPI):
+        self.api = api
+
+    async def _get(self, path, params=None):
+        return await asyncio.to_thread(self.api._get, path, params)
+
+    async def get_all_users(self):
+        return self.api._handle(await self._get("/admin/users")) or []
+
+    async def get_evaluations(self, filters=None):
+        return self.api._handle(await self._get("/admin/evaluations", filters)) or []
+
+    async def get_evaluations_keyed(self, filters=None):
+        """Evaluations plus an evaluation_frame() key, (url, ETag), when the backend sends an ETag."""
+        r = await self._get("/admin/evaluations", filters)
+        etag = r.headers.get("ETag")
+        return self.api._handle(r) or [], (r.url, etag) if etag else None
+
+    async def get_job_descriptions(self, active_only=False):
+        params = {"active_only": active_only} if active_only else {}
+        return self.api._handle(await self._get("/admin/job-descriptions", params)) or []
+
 # -----------------------
 # UI Helpers
 # -----------------------
@@ -109,6 +184,7 @@ def metric_card(title, value, icon):
 # -----------------------
 # Pages
 # -----------------------
+@rerun_profiler.profiled("login page")
 def admin_login_page(api: DashboardAPI):
     st.markdown("""
     <div class="dashboard-header">
@@ -132,34 +208,51 @@ def admin_login_page(api: DashboardAPI):
         else:
             st.error("❌ Invalid admin credentials")
 
+@rerun_profiler.profiled("overview tab")
 def overview_tab(api: DashboardAPI):
-    users = api.get_all_users()
-    evaluations = api.get_evaluations()
-    jobs = api.get_job_descriptions()
+    summary = api.get_summary()
+    if summary is None:
+        # no summary endpoint: fetch the full tables concurrently and reduce locally
+        aapi = AsyncDashboardAPI(api)
+        data = fetch_concurrently(
+            users=aapi.get_all_users(),
+            evaluations=aapi.get_evaluations_keyed(),
+            jobs=aapi.get_job_descriptions(),
+        )
+        evaluations, frame_key = data["evaluations"]
+        summary = summarize(data["users"], evaluations, data["jobs"], frame_key=frame_key)
 
     col1, col2, col3, col4 = st.columns(4)
-    metrics = [
-        ("Total Users", len(users), "👥"),
-        ("Evaluations", len(evaluations), "📊"),
-        ("Active Jobs", len([j for j in jobs if j.get("is_active")]), "💼"),
-        ("Avg Score", f"{sum(e['relevance_score'] for e in evaluations)/len(evaluations):.1f}" if evaluations else "0", "⭐")
+    avg_score = summary.get("avg_score")
+    cards = [
+        ("Total Users", summary["total_users"], "👥"),
+        ("Evaluations", summary["total_evaluations"], "📊"),
+        ("Active Jobs", summary["active_jobs"], "💼"),
+        ("Avg Score", f"{avg_score:.1f}" if avg_score is not None else "0", "⭐")
     ]
-    for i, (title, value, icon) in enumerate(metrics):
+    for i, (title, value, icon) in enumerate(cards):
         with [col1, col2, col3, col4][i]:
             st.markdown(metric_card(title, value, icon), unsafe_allow_html=True)
+    unscored = summary.get("unscored_evaluations")
+    if unscored:
+        st.caption(f"{unscored} evaluation(s) have no score yet and are left out of the average and histogram.")
 
-    if evaluations:
+    if summary["total_evaluations"]:
         col1, col2 = st.columns(2)
         with col1:
-            scores = [e["relevance_score"] for e in evaluations]
-            st.plotly_chart(px.histogram(x=scores, nbins=10, title="Score Distribution"), use_container_width=True)
+            edges, counts = summary["histogram"]["edges"], summary["histogram"]["counts"]
+            labels = [f"{lo:.0f}-{hi:.0f}" for lo, hi in zip(edges[:-1], edges[1:])]
+            st.plotly_chart(px.bar(x=labels, y=counts, labels={"x": "Score", "y": "Count"},
+                                   title="Score Distribution"),
+                            use_container_width=True)
         with col2:
-            verdicts = [e["verdict"] for e in evaluations]
-            st.plotly_chart(px.pie(values=pd.Series(verdicts).value_counts().values,
-                                   names=pd.Series(verdicts).value_counts().index,
+            verdicts = summary["verdict_counts"]
+            st.plotly_chart(px.pie(values=list(verdicts.values()),
+                                   names=list(verdicts.keys()),
                                    title="Verdict Distribution"),
                             use_container_width=True)
 
+@rerun_profiler.profiled("candidates tab")
 def candidates_tab(api: DashboardAPI):
     st.header("👥 Candidate Management")
 
@@ -168,20 +261,55 @@ def candidates_tab(api: DashboardAPI):
     max_score = col2.slider("Max Score", 0, 100, 100)
     verdict_filter = col3.selectbox("Verdict", ["All", "High", "Medium", "Low"])
 
-    filters = {}
-    if min_score > 0: filters["min_score"] = min_score
-    if max_score < 100: filters["max_score"] = max_score
-    if verdict_filter != "All": filters["verdict"] = verdict_filter
+    lo = min_score if min_score > 0 else None
+    hi = max_score if max_score < 100 else None
+    verdict = verdict_filter if verdict_filter != "All" else None
 
-    evaluations = api.get_evaluations(filters)
+    refresh = st.button("🔄 Refresh data", key="refresh_candidates")
 
-    if evaluations:
-        df = pd.DataFrame(evaluations)
-        st.dataframe(df[["id", "user_id", "relevance_score", "verdict", "created_at"]],
-                     use_container_width=True, height=400)
+    entry = peek_index(api.base_url)
+    if entry is None:
+        # cold load: show matching rows page by page while building the local index
+        chunks = []
+
+        def collect(frames):
+            for df in frames:
+                chunks.append(df)
+                yield EvaluationIndex(df).filter(lo, hi, verdict)[TABLE_COLUMNS]
+
+        shown = show_frames_progressively(st.empty(), collect(api.iter_evaluation_frames(columns=TABLE_COLUMNS)),
+                                          use_container_width=True, height=400)
+        # stored even when empty, so an empty table is not refetched on every rerun
+        frame = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=TABLE_COLUMNS)
+        index = store_index(api.base_url, EvaluationIndex(frame))
+        sync = api.evaluation_sync()
+        sync.reset()
+        sync.advance(*index.watermark())
     else:
+        index, age = entry
+        if refresh or age > EVALUATION_INDEX_TTL:
+            # pull only what changed since the last watermark
+            try:
+                delta = api.pull_evaluation_changes()
+            except requests.RequestException as e:
+                st.warning(f"⚠️ Backend unavailable, showing cached candidates: {e}")
+            else:
+                updates = to_frame(delta.upserts).reindex(columns=TABLE_COLUMNS) if delta.upserts else None
+                if delta.full:
+                    index = EvaluationIndex(updates if updates is not None else pd.DataFrame(columns=TABLE_COLUMNS))
+                elif delta:
+                    index = index.merge(updates, delta.deleted_ids)
+                store_index(api.base_url, index)
+        # slider / verdict changes are answered locally, no API call
+        view = index.filter(lo, hi, verdict)
+        shown = len(view)
+        if shown:
+            st.dataframe(view[TABLE_COLUMNS], use_container_width=True, height=400)
+
+    if not shown:
         st.info("No evaluations match filters.")
 
+@rerun_profiler.profiled("jobs tab")
 def jobs_tab(api: DashboardAPI):
     st.header("💼 Job Description Management")
 
@@ -213,14 +341,60 @@ def jobs_tab(api: DashboardAPI):
         with st.expander(f"{jd['title']} - {jd['company']}"):
             st.write(jd)
 
-def settings_tab():
+def performance_panel():
+    rows = transport.http_report()
+    if not rows:
+        st.info("No API requests recorded yet.")
+        return
+    df = pd.DataFrame(rows).sort_values("p95_ms", ascending=False)
+    df["cache_hit_rate"] = df["cache_hit_rate"] * 100.0
+    st.dataframe(df, use_container_width=True, hide_index=True, column_config={
+        "p50_ms": st.column_config.NumberColumn("p50 (ms)", format="%.1f"),
+        "p95_ms": st.column_config.NumberColumn("p95 (ms)", format="%.1f"),
+        "mean_ms": st.column_config.NumberColumn("mean (ms)", format="%.1f"),
+        "json_ms": st.column_config.NumberColumn("JSON decode (ms)", format="%.2f"),
+        "cache_hit_rate": st.column_config.NumberColumn("cache hit rate", format="%.0f%%"),
+    })
+    st.download_button("⬇️ Prometheus metrics", metrics.to_prometheus(),
+                       file_name="metrics.prom", mime="text/plain")
+
+def export_panel(api: DashboardAPI):
+    col1, col2, col3, col4 = st.columns(4)
+    min_score = col1.slider("Min Score", 0, 100, 0, key="export_min_score")
+    max_score = col2.slider("Max Score", 0, 100, 100, key="export_max_score")
+    verdict_filter = col3.selectbox("Verdict", ["All", "High", "Medium", "Low"], key="export_verdict")
+    fmt = col4.selectbox("Format", export.available_formats(), key="export_format",
+                         format_func=str.upper)
+
+    lo = min_score if min_score > 0 else None
+    hi = max_score if max_score < 100 else None
+    verdict = verdict_filter if verdict_filter != "All" else None
+
+    def build():
+        # streamed page by page from the API; the table is never loaded into a DataFrame.
+        # Filters go to the server; the local pass only matters if it ignores them.
+        pages = api.iter_export_pages(export.server_filters(lo, hi, verdict))
+        return export.export_buffer(export.filter_pages(pages, lo, hi, verdict), fmt)
+
+    st.download_button("⬇️ Export evaluations", build, file_name=export.export_file_name("evaluations", fmt),
+                       mime=export.export_mime(fmt), on_click="ignore")
+    st.caption("Exports every evaluation matching the filters, fetched page by page when you click.")
+
+@rerun_profiler.profiled("settings tab")
+def settings_tab(api: DashboardAPI):
     st.header("⚙️ System Settings")
     st.info("Placement team features coming soon...")
     st.write("• User management")
     st.write("• Analytics & reports")
-    st.write("• Export data")
     st.write("• Notifications")
 
+    st.subheader("📤 Export Evaluations")
+    export_panel(api)
+
+    st.subheader("📈 Performance")
+    if st.checkbox("Show API performance metrics", key="show_performance"):
+        performance_panel()
+
 # -----------------------
 # App Entrypoint
 # -----------------------
@@ -247,7 +421,10 @@ def main():
         with tab1: overview_tab(api)
         with tab2: candidates_tab(api)
         with tab3: jobs_tab(api)
-        with tab4: settings_tab()
+        with tab4: settings_tab(api)
+    show_report(st.sidebar)
 
 if __name__ == "__main__":
-    main()
+    with rerun_profiler.rerun(st.session_state, "dashboard_app"):
+        main()
+    rerun_profiler.show(st.sidebar, st.session_state)
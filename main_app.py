@@ -1,16 +1,24 @@
 # main_app.py
+from utils.import_profiler import get_import_profiler, show_report
+get_import_profiler()  # before anything else, so the report covers the app's imports
 import os
+import glob
 import importlib
+import time
 import streamlit as st
 from dotenv import load_dotenv
-from components.api_client import APIClient
+from components import metrics
+from components.health import get_health_monitor
+from utils import rerun_profiler
 
 load_dotenv()
+metrics.start_exporter()
 
 # -----------------------
 # Initialize Session State
 # -----------------------
 DEFAULT_PAGE = "Home"
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
 
 if "current_page" not in st.session_state:
     st.session_state.current_page = DEFAULT_PAGE
@@ -19,63 +27,97 @@ if "token" not in st.session_state:
 if "user_info" not in st.session_state:
     st.session_state.user_info = {}
 
-# -----------------------
-# Sidebar Navigation
-# -----------------------
-st.sidebar.title("📌 Navigation")
-
-# Page map (keys = file names, values = display titles)
-pages = {
-    "Home": "🏠 Home",
-    "User_Login": "👤 Student Login",
-    "Admin_Login": "👑 Admin Login",
-    "Register": "📝 Register",
-    "Forgot_Password": "🔐 Forgot Password",
-    "Student_Dashboard": "🎯 Student Dashboard",
-    "Admin_Dashboard": "📊 Admin Dashboard",
-}
-
-# Radio selection
-choice = st.sidebar.radio("Go to", list(pages.keys()), format_func=lambda k: pages[k])
-
-# Navigation button
-if st.sidebar.button("➡️ Go"):
-    st.session_state.current_page = choice
-    st.experimental_rerun()
 
-# -----------------------
-# User Info / Session
-# -----------------------
-if st.session_state.token:
-    user = st.session_state.get("user_info", {})
+def page_module(name):
+    """Module name of a page; files may carry a prefix, e.g. 2_👤_User_Login.py."""
+    stems = [os.path.splitext(os.path.basename(p))[0] for p in glob.glob(os.path.join(PAGES_DIR, "*.py"))]
+    if name not in stems:
+        name = next((s for s in sorted(stems) if s.endswith(f"_{name}")), name)
+    return f"pages.{name}"
+
+
+def main():
+    # -----------------------
+    # Sidebar Navigation
+    # -----------------------
+    st.sidebar.title("📌 Navigation")
+
+    # Page map (keys = file names, values = display titles)
+    pages = {
+        "Home": "🏠 Home",
+        "User_Login": "👤 Student Login",
+        "Admin_Login": "👑 Admin Login",
+        "Register": "📝 Register",
+        "Forgot_Password": "🔐 Forgot Password",
+        "Student_Dashboard": "🎯 Student Dashboard",
+        "Admin_Dashboard": "📊 Admin Dashboard",
+    }
+
+    # Radio selection
+    choice = st.sidebar.radio("Go to", list(pages.keys()), format_func=lambda k: pages[k])
+
+    # Navigation button
+    if st.sidebar.button("➡️ Go"):
+        st.session_state.current_page = choice
+        st.experimental_rerun()
+
+    # -----------------------
+    # User Info / Session
+    # -----------------------
+    if st.session_state.token:
+        user = st.session_state.get("user_info", {})
+        st.sidebar.markdown("---")
+        st.sidebar.success(f"✅ Logged in as **{user.get('email', 'Unknown')}**")
+        if st.sidebar.button("🚪 Logout"):
+            st.session_state.token = None
+            st.session_state.user_info = {}
+            st.session_state.current_page = DEFAULT_PAGE
+            st.experimental_rerun()
+    else:
+        st.sidebar.info("Not logged in")
+
+    # -----------------------
+    # Health Check
+    # -----------------------
     st.sidebar.markdown("---")
-    st.sidebar.success(f"✅ Logged in as **{user.get('email', 'Unknown')}**")
-    if st.sidebar.button("🚪 Logout"):
-        st.session_state.token = None
-        st.session_state.user_info = {}
+    # probed on a background thread; rendering never waits for /health
+    with rerun_profiler.section("health snapshot"):
+        health = get_health_monitor().snapshot()
+    if health["healthy"] is None:
+        st.sidebar.info("API: ⏳ Checking...")
+    elif health["healthy"]:
+        st.sidebar.success("API: ✅ Online")
+    else:
+        st.sidebar.error("API: ❌ Offline")
+    breaker = health["breaker"]
+    if breaker and breaker["state"] != "closed":
+        retry = f", retrying in {breaker['retry_in']:.0f}s" if breaker["retry_in"] is not None else ""
+        st.sidebar.warning(f"Circuit {breaker['state'].replace('_', '-')}: serving cached data{retry}")
+    if health["checked_at"]:
+        st.sidebar.caption(f"Latency {health['latency'] * 1000:.0f} ms · checked {health['age']:.0f}s ago")
+    if health["errors"]:
+        with st.sidebar.expander(f"Recent errors ({len(health['errors'])})"):
+            for err in reversed(health["errors"][-5:]):
+                st.caption(f"{time.strftime('%H:%M:%S', time.localtime(err['at']))} {err['error']}")
+
+    show_report(st.sidebar)
+
+    # -----------------------
+    # Load Selected Page
+    # -----------------------
+    # only the selected page is imported; its heavy deps load lazily (utils/lazy.py)
+    try:
+        with rerun_profiler.section("import page"):
+            module = importlib.import_module(page_module(st.session_state.current_page))
+        with rerun_profiler.section(f"page {st.session_state.current_page}"):
+            module.show()
+    except Exception as e:
+        st.error(f"⚠️ Page error: {e}")
         st.session_state.current_page = DEFAULT_PAGE
         st.experimental_rerun()
-else:
-    st.sidebar.info("Not logged in")
 
-# -----------------------
-# Health Check
-# -----------------------
-st.sidebar.markdown("---")
-api = APIClient()
-health = api.health()
-if health.get("status") == "healthy":
-    st.sidebar.success("API: ✅ Online")
-else:
-    st.sidebar.error("API: ❌ Offline")
 
-# -----------------------
-# Load Selected Page
-# -----------------------
-try:
-    module = importlib.import_module(f"pages.{st.session_state.current_page}")
-    module.show()
-except Exception as e:
-    st.error(f"⚠️ Page error: {e}")
-    st.session_state.current_page = DEFAULT_PAGE
-    st.experimental_rerun()
+# no-op unless RERUN_PROFILE=1; also records reruns that leave through st.experimental_rerun()
+with rerun_profiler.rerun(st.session_state, f"main_app · {st.session_state.current_page}"):
+    main()
+rerun_profiler.show(st.sidebar, st.session_state)
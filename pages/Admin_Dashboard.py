@@ -1,7 +1,11 @@
 # pages/Admin_Dashboard.py
 import streamlit as st
-import pandas as pd
-from components.api_client import APIClient
+from components.api_client import APIClient, cache_stats, flatten_batch_results, revalidation_stats
+from components.pagination import show_frames_progressively
+from utils.evaluations import evaluation_frame
+from utils.lazy import lazy_import
+
+pd = lazy_import("pandas")
 
 def show():
     api = APIClient()
@@ -102,20 +106,47 @@ def show():
 
     st.markdown("---")
 
+    # -----------------------
+    # BATCH RANKING
+    # -----------------------
+    st.subheader("🏆 Rank All Resumes for a Job")
+    if jobs and resumes:
+        job_map = {j["id"]: f"{j.get('title')} @ {j.get('company', '')}" for j in jobs}
+        rank_job_id = st.selectbox("Job to rank against", options=list(job_map.keys()),
+                                   format_func=lambda x: job_map[x], key="rank_job_id")
+        if st.button("🏆 Rank Resumes"):
+            bar = st.progress(0.0)
+            results = api.rank_resumes_for_job(
+                rank_job_id, [r["id"] for r in resumes],
+                on_progress=lambda done, total, _: bar.progress(done / total),
+            )
+            failed = sum(1 for r in results if not r["ok"])
+            st.dataframe(pd.DataFrame(flatten_batch_results(results)))
+            if failed:
+                st.warning(f"⚠️ {failed} of {len(results)} evaluations failed")
+    else:
+        st.info("Need at least one job and one resume to rank.")
+
+    st.markdown("---")
+
     # -----------------------
     # EVALUATIONS
     # -----------------------
     st.subheader("🎯 Evaluation Results")
-    evs = api.get_evaluations()
-    if evs:
-        if isinstance(evs, dict):
-            st.json(evs)
-        elif isinstance(evs, list):
-            df = pd.DataFrame(evs)
-            st.dataframe(df)
+    evaluations = api.cached_evaluations()
+    if evaluations is None:
+        # cold load: render page by page while the walk fills the read cache
+        shown = show_frames_progressively(st.empty(), api.iter_evaluation_frames(cache=True))
     else:
+        shown = len(evaluations)
+        if shown:
+            st.dataframe(evaluation_frame(evaluations, api.frame_key(evaluations)))
+    if not shown:
         st.info("No evaluations available.")
 
     st.markdown("---")
 
+    with st.expander("📶 API Cache Statistics"):
+        st.json({"cache": cache_stats(), "revalidation": revalidation_stats()})
+
     st.success("✅ Admin Dashboard loaded successfully")
@@ -1,6 +1,8 @@
 # pages/Home.py
 import streamlit as st
 from components.api_client import APIClient
+from components.async_client import AsyncAPIClient, fetch_concurrently
+from components.health import get_health_monitor
 
 def show():
     st.markdown("<h1 style='text-align:center; color:#1E88E5;'>📄 Innomatics Resume Relevance System</h1>", unsafe_allow_html=True)
@@ -8,15 +10,25 @@ def show():
 
     api = APIClient()
 
+    # independent reads, fetched together so the page waits for the slowest one only
+    aapi = AsyncAPIClient(api)
+    data = fetch_concurrently(
+        jobs=aapi.get_jobs(),
+        resumes=aapi.get_resumes(),
+        evaluations=aapi.get_evaluations(),
+    )
+
     # -----------------------
     # API Health
     # -----------------------
     st.subheader("⚡ System Health Check")
-    health = api.health()
-    if health.get("status") == "healthy":
-        st.success("✅ Backend API is running")
+    health = get_health_monitor().snapshot()
+    if health["healthy"] is None:
+        st.info("⏳ Checking backend API...")
+    elif health["healthy"]:
+        st.success(f"✅ Backend API is running ({health['latency'] * 1000:.0f} ms)")
     else:
-        st.error(f"❌ API error: {health}")
+        st.error(f"❌ API error: {health['status']}")
 
     st.markdown("---")
 
@@ -24,7 +36,7 @@ def show():
     # Jobs Overview
     # -----------------------
     st.subheader("💼 Job Descriptions (from backend)")
-    jobs = api.get_jobs()
+    jobs = data["jobs"]
     job_data = []
     if isinstance(jobs, dict) and jobs.get("status") == "success":
         job_data = jobs.get("data", [])
@@ -44,7 +56,7 @@ def show():
     # Resumes Overview
     # -----------------------
     st.subheader("📄 Resumes (from backend)")
-    resumes = api.get_resumes()
+    resumes = data["resumes"]
     resume_data = []
     if isinstance(resumes, dict) and resumes.get("status") == "success":
         resume_data = resumes.get("data", [])
@@ -64,7 +76,7 @@ def show():
     # Evaluations Overview
     # -----------------------
     st.subheader("🎯 Evaluations (from backend)")
-    evaluations = api.get_evaluations()
+    evaluations = data["evaluations"]
     if evaluations:
         if isinstance(evaluations, dict):
             st.json(evaluations)
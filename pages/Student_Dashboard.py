@@ -1,7 +1,10 @@
 # pages/Student_Dashboard.py
 import streamlit as st
-import pandas as pd
-from components.api_client import APIClient
+from components.api_client import APIClient, flatten_batch_results
+from utils.evaluations import evaluation_frame
+from utils.lazy import lazy_import
+
+pd = lazy_import("pandas")
 
 def show():
     api = APIClient()
@@ -114,6 +117,15 @@ def show():
             if result.get("status") == "success":
                 st.success(f"✅ Score: {result['data']['score']} | Verdict: {result['data']['verdict']}")
                 st.session_state.last_eval = result
+
+        active_ids = [j["id"] for j in jobs if j.get("is_active", True)]
+        if st.button(f"🔍 Match Resume to All Active Jobs ({len(active_ids)})"):
+            bar = st.progress(0.0)
+            results = api.match_resume_to_jobs(
+                rid, active_ids,
+                on_progress=lambda done, total, _: bar.progress(done / total),
+            )
+            st.dataframe(pd.DataFrame(flatten_batch_results(results)))
     else:
         st.warning("Please create/select both a resume and a job before evaluation.")
 
@@ -123,13 +135,16 @@ def show():
     # HISTORY SECTION
     # -----------------------
     st.subheader("📊 Evaluation History")
-    evs = api.get_evaluations()
+    if job_id and st.checkbox("Only the selected job"):
+        evs, key = api.query_evaluations_keyed(job_id=job_id)
+    else:
+        evs = api.get_evaluations()
+        key = api.frame_key(evs)
     if evs:
         if isinstance(evs, dict):
             st.json(evs)
         elif isinstance(evs, list) and len(evs) > 0:
-            df_evs = pd.DataFrame(evs)
-            st.dataframe(df_evs)
+            st.dataframe(evaluation_frame(evs, key))
         else:
             st.info("No evaluation results yet.")
     else:
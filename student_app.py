@@ -1,14 +1,23 @@
 # student_app.py
+from utils.import_profiler import get_import_profiler, show_report
+get_import_profiler()  # before anything else, so the report covers the app's imports
 import streamlit as st
-import requests
 import json
 import time
 import os
+import uuid
 from dotenv import load_dotenv
+from components import evaluation_jobs, export, metrics, transport, uploads
+from utils import rerun_profiler
+from utils.extraction_cache import content_key, get_extraction_cache
+from utils.helpers import score_resume
+from utils.jd_index import get_jd_index
 
 # Load environment variables
 load_dotenv()
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
+EVALUATION_POLL_INTERVAL = float(os.getenv("EVALUATION_POLL_INTERVAL", "2"))
+metrics.start_exporter()
 
 st.set_page_config(
     page_title="Innomatics Resume Checker - Student Portal",
@@ -63,7 +72,7 @@ class APIClient:
                 "password": password,
                 "grant_type": "password"
             }
-            response = requests.post(f"{self.base_url}/token", data=form_data)
+            response = transport.post(f"{self.base_url}/token", data=form_data)
             if response.status_code == 200:
                 return response.json()
             return None
@@ -79,7 +88,7 @@ class APIClient:
                 "full_name": full_name,
                 "is_admin": is_admin
             }
-            response = requests.post(f"{self.base_url}/register", json=data)
+            response = transport.post(f"{self.base_url}/register", json=data)
             return response.status_code == 200
         except Exception as e:
             st.error(f"Registration error: {str(e)}")
@@ -87,10 +96,20 @@ class APIClient:
     
     def upload_file(self, file):
         try:
-            files = {"file": (file.name, file.getvalue(), file.type)}
+            # hash the upload buffer in place; same bytes already extracted -> skip the upload
+            with file.getbuffer() as view:
+                key = content_key(view)
+            cache = get_extraction_cache()
+            cached = cache.get(key)
+            if cached:
+                return cached
             headers = self.get_headers()
-            response = requests.post(f"{self.base_url}/upload-file", files=files, headers=headers)
-            return response.json() if response.status_code == 200 else None
+            response = uploads.upload_file(self.base_url, file, headers=headers)
+            if response.status_code != 200:
+                return None
+            result = response.json()
+            cache.put(key, result)
+            return result
         except Exception as e:
             st.error(f"Upload error: {str(e)}")
             return None
@@ -98,16 +117,32 @@ class APIClient:
     def create_evaluation(self, evaluation_data):
         try:
             headers = self.get_headers()
-            response = requests.post(f"{self.base_url}/evaluations", json=evaluation_data, headers=headers)
+            response = transport.post(f"{self.base_url}/evaluations", json=evaluation_data, headers=headers,
+                                      timeout=evaluation_jobs.evaluation_timeout())
             return response.json() if response.status_code == 200 else None
         except Exception as e:
             st.error(f"Evaluation error: {str(e)}")
             return None
     
+    def submit_evaluation(self, evaluation_data):
+        try:
+            return evaluation_jobs.submit(self.base_url, evaluation_data, headers=self.get_headers(),
+                                          owner=st.session_state.get('evaluation_owner'))
+        except Exception as e:
+            st.error(f"Evaluation error: {str(e)}")
+            return None
+    
+    def evaluation_status(self, handle, wait=0):
+        try:
+            return evaluation_jobs.status(self.base_url, handle, headers=self.get_headers(), wait=wait)
+        except Exception:
+            # network blip: keep the evaluation queued and poll again later
+            return {"status": "running", "progress": None, "result": None, "error": None}
+    
     def get_job_descriptions(self):
         try:
             headers = self.get_headers()
-            response = requests.get(f"{self.base_url}/job-descriptions", headers=headers)
+            response = transport.get(f"{self.base_url}/job-descriptions", headers=headers)
             return response.json() if response.status_code == 200 else []
         except Exception as e:
             st.error(f"Error fetching job descriptions: {str(e)}")
@@ -116,7 +151,7 @@ class APIClient:
     def get_user_info(self):
         try:
             headers = self.get_headers()
-            response = requests.get(f"{self.base_url}/me", headers=headers)
+            response = transport.get(f"{self.base_url}/me", headers=headers)
             return response.json() if response.status_code == 200 else None
         except Exception as e:
             st.error(f"Error fetching user info: {str(e)}")
@@ -126,12 +161,13 @@ class APIClient:
         try:
             headers = self.get_headers()
             user_id = st.session_state.get('user_id')
-            response = requests.get(f"{self.base_url}/users/{user_id}/evaluations", headers=headers)
+            response = transport.get(f"{self.base_url}/users/{user_id}/evaluations", headers=headers)
             return response.json() if response.status_code == 200 else []
         except Exception as e:
             st.error(f"Error fetching evaluations: {str(e)}")
             return []
 
+@rerun_profiler.profiled("login page")
 def login_page():
     st.markdown('<h1 class="main-header">📄 Innomatics Resume Relevance Checker</h1>', unsafe_allow_html=True)
     
@@ -176,6 +212,7 @@ def login_page():
                 else:
                     st.error("Passwords do not match")
 
+@rerun_profiler.profiled("main app")
 def main_app():
     api_client = APIClient()
     
@@ -193,7 +230,7 @@ def main_app():
     # Navigation
     tab1, tab2 = st.tabs(["🎯 New Evaluation", "📊 My Evaluations"])
     
-    with tab1:
+    with tab1, rerun_profiler.section("new evaluation tab"):
         st.header("🎯 New Resume Evaluation")
         
         # Initialize session state
@@ -203,6 +240,13 @@ def main_app():
             st.session_state.resume_text = ""
         if 'results' not in st.session_state:
             st.session_state.results = None
+        if 'pending_evaluations' not in st.session_state:
+            st.session_state.pending_evaluations = []
+        if 'failed_evaluations' not in st.session_state:
+            st.session_state.failed_evaluations = []
+        if 'evaluation_owner' not in st.session_state:
+            # this session's pool for evaluations run locally (see components/evaluation_jobs.py)
+            st.session_state.evaluation_owner = uuid.uuid4().hex
         
         # Get job descriptions
         job_descriptions = api_client.get_job_descriptions()
@@ -221,6 +265,7 @@ def main_app():
         
         selected_jd = st.selectbox("📋 Select Job Description", options=list(jd_options.keys()), 
                                  format_func=lambda x: jd_options[x])
+        jd_by_id = {jd['id']: jd for jd in job_descriptions}
         
         # File upload section
         col1, col2 = st.columns(2)
@@ -245,47 +290,113 @@ def main_app():
             with st.expander("👀 Preview Resume Text"):
                 st.text(st.session_state.resume_text[:500] + "..." if len(st.session_state.resume_text) > 500 
                        else st.session_state.resume_text)
+            
+            # shared index only re-tokenizes JDs that changed since the last rerun
+            jd_index = get_jd_index()
+            jd_index.update(job_descriptions)
+            with st.expander("🔎 Best-Matching Active Jobs (instant estimate)"):
+                for match in jd_index.match(st.session_state.resume_text, top_k=5):
+                    st.write(f"**{match['title']} - {match['company']}** — "
+                             f"{match['relevance_score']:.1f}/100 ({match['verdict']})")
         
         # Evaluation button
         if st.session_state.resume_text and selected_jd:
             if st.button("🚀 Evaluate Resume", type="primary", use_container_width=True):
-                with st.spinner("Analyzing your resume..."):
-                    progress_bar = st.progress(0)
-                    for i in range(100):
-                        time.sleep(0.01)
-                        progress_bar.progress(i + 1)
-                    
-                    evaluation_data = {
-                        "resume_text": st.session_state.resume_text,
-                        "resume_file_name": resume_file.name if resume_file else "manual_input.txt",
-                        "job_description_id": selected_jd
-                    }
-                    
-                    results = api_client.create_evaluation(evaluation_data)
-                    if results:
-                        st.session_state.results = results
-                        st.session_state.selected_jd = selected_jd
-                        st.success("✅ Evaluation complete!")
-                        st.rerun()
+                evaluation_data = {
+                    "resume_text": st.session_state.resume_text,
+                    "resume_file_name": resume_file.name if resume_file else "manual_input.txt",
+                    "job_description_id": selected_jd
+                }
+                
+                handle = api_client.submit_evaluation(evaluation_data)
+                if handle:
+                    handle["label"] = jd_options[selected_jd]
+                    handle["job_description_id"] = selected_jd
+                    st.session_state.pending_evaluations.append(handle)
+                    st.success("✅ Evaluation queued — you can keep working or queue more.")
+                else:
+                    # backend slow or down: fall back to the local estimate
+                    st.session_state.results = score_resume(st.session_state.resume_text, jd_by_id[selected_jd], job_descriptions)
+                    st.session_state.selected_jd = selected_jd
+        
+            if st.button("⚡ Quick Preview (offline estimate)", use_container_width=True):
+                st.session_state.results = score_resume(st.session_state.resume_text, jd_by_id[selected_jd], job_descriptions)
+                st.session_state.selected_jd = selected_jd
+        
+        if st.session_state.failed_evaluations:
+            failed_evaluations_panel()
+        if st.session_state.pending_evaluations:
+            pending_evaluations_panel(api_client)
         
         # Display results
         if st.session_state.get('results'):
             display_results(st.session_state.results)
     
-    with tab2:
+    with tab2, rerun_profiler.section("history tab"):
         st.header("📊 My Evaluation History")
         evaluations = api_client.get_user_evaluations()
         
         if evaluations:
+            col1, col2 = st.columns([1, 3])
+            fmt = col1.selectbox("Format", export.available_formats(), key="history_export_format",
+                                 format_func=str.upper, label_visibility="collapsed")
+            with col2:
+                # the history is already loaded; the file is only built when clicked
+                st.download_button("📥 Download all evaluations", lambda: export.export_buffer([evaluations], fmt),
+                                   file_name=export.export_file_name("my_evaluations", fmt),
+                                   mime=export.export_mime(fmt), on_click="ignore")
             for eval in evaluations:
                 with st.expander(f"Evaluation #{eval['id']} - Score: {eval['relevance_score']}% - {eval['verdict']}"):
                     display_evaluation_summary(eval)
         else:
             st.info("No evaluations yet. Submit your first resume for evaluation!")
 
+@rerun_profiler.profiled("queued evaluations")
+def pending_evaluations_panel(api_client):
+    st.subheader("⏳ Queued Evaluations")
+    pending = st.session_state.pending_evaluations
+    still_pending = []
+    for handle in pending:
+        status = api_client.evaluation_status(handle)
+        if status["status"] == "completed":
+            st.session_state.results = status["result"]
+            st.session_state.selected_jd = handle["job_description_id"]
+        elif status["status"] == "failed":
+            # kept until dismissed; the fragment's next tick would otherwise wipe it
+            st.session_state.failed_evaluations.append(
+                {"id": handle["id"], "label": handle["label"], "error": status["error"] or "evaluation failed"})
+        else:
+            progress = status["progress"]
+            st.write(f"**{handle['label']}** — {status['status']}"
+                     + (f" ({progress:.0f}%)" if progress is not None else ""))
+            st.progress(int(progress or 0))
+            still_pending.append(handle)
+    st.session_state.pending_evaluations = still_pending
+    if len(still_pending) != len(pending):
+        # show results / failures on the full page; an empty queue also stops the polling
+        st.rerun()
+    elif still_pending and _fragment is None:
+        st.button("🔄 Refresh status", key="refresh_evaluations")
+
+def failed_evaluations_panel():
+    for failure in list(st.session_state.failed_evaluations):
+        col1, col2 = st.columns([5, 1])
+        col1.error(f"❌ {failure['label']}: {failure['error']}")
+        if col2.button("Dismiss", key=f"dismiss_{failure['id']}"):
+            st.session_state.failed_evaluations.remove(failure)
+            st.rerun()
+
+# Poll queued evaluations on a timer without rerunning the whole page (when supported)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+if _fragment is not None:
+    pending_evaluations_panel = _fragment(run_every=EVALUATION_POLL_INTERVAL)(pending_evaluations_panel)
+
+@rerun_profiler.profiled("results")
 def display_results(results):
     st.divider()
     st.header("📊 Evaluation Results")
+    if results.get('source') == 'local':
+        st.info("ℹ️ Offline estimate computed locally — run a full evaluation for the official score.")
     
     # Score and Verdict
     col1, col2, col3 = st.columns(3)
@@ -370,6 +481,9 @@ def main():
         login_page()
     else:
         main_app()
+    show_report(st.sidebar)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with rerun_profiler.rerun(st.session_state, "student_app"):
+        main()
+    rerun_profiler.show(st.sidebar, st.session_state)
\ No newline at end of file
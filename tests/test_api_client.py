@@ -0,0 +1,89 @@
+# tests/test_api_client.py
+import json
+import threading
+import time
+import pytest
+from components import api_client
+from components.api_client import APIClient, JOBS_PATH
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.text = json.dumps(payload)
+        self.content = self.text.encode()
+        self.headers = {}
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(api_client, "get_local_store", lambda: None)
+    api_client.clear_cache()
+    yield APIClient()
+    api_client.clear_cache()
+
+
+def test_read_after_write_never_sees_an_in_flight_pre_write_response(client, monkeypatch):
+    old, new = [{"id": 1}], [{"id": 1}, {"id": 2}]
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            # the pre-write read: still on the wire when the write lands
+            started.set()
+            release.wait(5)
+            return FakeResponse(old)
+        return FakeResponse(new)
+
+    monkeypatch.setattr(api_client.transport, "get", get)
+    monkeypatch.setattr(api_client.transport, "post", lambda url, **kwargs: FakeResponse({"id": 2}))
+
+    before = {}
+    reader = threading.Thread(target=lambda: before.setdefault("jobs", client.get_jobs()))
+    reader.start()
+    assert started.wait(5)
+
+    client.create_job({"title": "new"})
+    # must not join the older flight, and must see the write
+    assert client.get_jobs() == new
+
+    release.set()
+    reader.join(5)
+    assert before["jobs"] == old
+    # the late pre-write response was not written back over the fresh entry
+    assert client.get_jobs() == new
+    assert len(calls) == 2
+
+
+def test_concurrent_reads_share_one_request(client, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        started.set()
+        release.wait(5)
+        return FakeResponse([{"id": 1}])
+
+    monkeypatch.setattr(api_client.transport, "get", get)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get_jobs())) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    deadline = time.monotonic() + 5
+    while sum(api_client._flight.in_flight().values()) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert results == [[{"id": 1}]] * 4
+    assert calls == [f"{client.base}{JOBS_PATH}"]
@@ -0,0 +1,65 @@
+# tests/test_cache.py
+import pytest
+from components import cache as cache_module
+from components.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return lambda seconds: now.__setitem__(0, now[0] + seconds)
+
+
+def test_entry_expires_after_ttl(clock):
+    c = TTLCache()
+    c.set("a", 1, ttl=10)
+    clock(9.9)
+    assert c.get("a") == 1
+    clock(0.1)
+    assert c.get("a") is None
+    assert c.stats()["entries"] == 0
+
+
+def test_zero_ttl_and_oversized_values_are_not_stored(clock):
+    c = TTLCache(max_bytes=100)
+    c.set("a", 1, ttl=0)
+    c.set("b", 2, ttl=10, size=101)
+    assert c.get("a") is None and c.get("b") is None
+
+
+def test_evicts_least_recently_used_beyond_maxsize(clock):
+    c = TTLCache(maxsize=2)
+    c.set("a", 1, ttl=10)
+    c.set("b", 2, ttl=10)
+    assert c.get("a") == 1  # "b" is now the oldest
+    c.set("c", 3, ttl=10)
+    assert c.get("b") is None
+    assert c.get("a") == 1 and c.get("c") == 3
+
+
+def test_evicts_until_under_max_bytes(clock):
+    c = TTLCache(max_bytes=100)
+    c.set("a", 1, ttl=10, size=40)
+    c.set("b", 2, ttl=10, size=40)
+    c.set("c", 3, ttl=10, size=40)
+    assert c.get("a") is None
+    assert c.stats()["bytes"] == 80
+
+
+def test_replacing_a_key_updates_byte_count(clock):
+    c = TTLCache(max_bytes=100)
+    c.set("a", 1, ttl=10, size=60)
+    c.set("a", 2, ttl=10, size=30)
+    assert c.get("a") == 2
+    assert c.stats()["bytes"] == 30
+
+
+def test_invalidate_prefix(clock):
+    c = TTLCache()
+    for key in ("http://x/jobs/", "http://x/jobs/1", "http://x/evaluations"):
+        c.set(key, key, ttl=10, size=1)
+    c.invalidate_prefix("http://x/jobs/")
+    assert c.get("http://x/jobs/1") is None
+    assert c.get("http://x/evaluations") == "http://x/evaluations"
+    assert c.stats()["bytes"] == 1
@@ -0,0 +1,88 @@
+# tests/test_resilience.py
+import pytest
+import requests
+from components import resilience
+from components.resilience import CircuitBreaker, CircuitOpenError
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    b = CircuitBreaker("http://stub", failures=2, reset_timeout=30)
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(resilience, "get_breaker", lambda url: b)
+    b.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+    return b
+
+
+def fail(error):
+    def do_request():
+        raise error
+    return do_request
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            resilience.send("POST", "http://stub/x", fail(requests.exceptions.ConnectionError("down")), False)
+    assert breaker.state == "open"
+
+
+def test_opens_after_consecutive_failures_and_fails_fast(breaker):
+    trip(breaker)
+    with pytest.raises(CircuitOpenError):
+        resilience.send("POST", "http://stub/x", lambda: FakeResponse(200), False)
+
+
+def test_half_open_trial_success_closes(breaker):
+    trip(breaker)
+    breaker.advance(31)
+    assert resilience.send("POST", "http://stub/x", lambda: FakeResponse(200), False).status_code == 200
+    assert breaker.state == "closed" and breaker.failures == 0
+
+
+def test_half_open_trial_failure_reopens(breaker):
+    trip(breaker)
+    breaker.advance(31)
+    resilience.send("POST", "http://stub/x", lambda: FakeResponse(500), False)
+    assert breaker.state == "open"
+
+
+def test_half_open_trial_in_flight_rejects_others(breaker):
+    trip(breaker)
+    breaker.advance(31)
+    breaker.before_request()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_unexpected_trial_error_does_not_wedge_half_open(breaker):
+    trip(breaker)
+    breaker.advance(31)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        resilience.send("POST", "http://stub/x", fail(requests.exceptions.ChunkedEncodingError("cut")), False)
+    assert breaker.state == "open"
+    breaker.advance(31)
+    assert resilience.send("POST", "http://stub/x", lambda: FakeResponse(200), False).status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_local_error_releases_trial_without_counting_a_failure(breaker):
+    trip(breaker)
+    breaker.advance(31)
+    with pytest.raises(ValueError):
+        resilience.send("POST", "http://stub/x", fail(ValueError("bad payload")), False)
+    assert breaker.state == "half_open"
+    assert breaker.failures == breaker.failure_threshold
+    assert resilience.send("POST", "http://stub/x", lambda: FakeResponse(200), False).status_code == 200
+    assert breaker.state == "closed"
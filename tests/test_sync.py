@@ -0,0 +1,71 @@
+# tests/test_sync.py
+import pandas as pd
+from components.sync import DeltaSync
+from utils.evaluation_index import EvaluationIndex
+from utils.evaluations import to_frame
+
+
+def rows(*ids, score=50.0):
+    return [{"id": i, "relevance_score": score, "verdict": "Medium",
+             "created_at": f"2025-01-0{i}T00:00:00"} for i in ids]
+
+
+def test_full_then_delta_with_deletes():
+    sync = DeltaSync()
+    full = sync.pull(lambda params: rows(1, 2, 3))
+    assert full.full and [r["id"] for r in sync.items()] == [1, 2, 3]
+
+    seen = []
+
+    def fetch(params):
+        seen.append(params)
+        return {"items": rows(4) + [{"id": 1, "deleted": True}], "deleted_ids": [2],
+                "watermark": {"since_id": 4}}
+    delta = sync.pull(fetch)
+    assert seen == [{"since_id": 3, "updated_after": "2025-01-03T00:00:00"}]
+    assert not delta.full
+    assert sorted(delta.deleted_ids) == [1, 2]
+    assert [r["id"] for r in sync.items()] == [3, 4]
+    assert sync.since_id == 4
+
+
+def test_paged_delta_collects_deletes_from_every_page():
+    sync = DeltaSync()
+    sync.pull(lambda params: rows(1, 2, 3))
+    pages = {
+        None: {"items": rows(4), "deleted_ids": [1], "next_cursor": "p2"},
+        "p2": {"items": rows(5), "deleted_ids": [2], "watermark": {"since_id": 5}},
+    }
+    delta = sync.pull(lambda params: pages[params.get("cursor")])
+    assert sorted(delta.deleted_ids) == [1, 2]
+    assert [r["id"] for r in sync.items()] == [3, 4, 5]
+
+
+def test_items_list_is_reused_until_the_data_changes():
+    sync = DeltaSync()
+    sync.pull(lambda params: rows(1))
+    first = sync.items()
+    assert sync.pull(lambda params: {"items": [], "deleted_ids": []}).__bool__() is False
+    assert sync.items() is first
+    sync.pull(lambda params: {"items": rows(2), "deleted_ids": []})
+    assert sync.items() is not first
+
+
+def test_index_merge_upserts_and_deletes():
+    index = EvaluationIndex(to_frame(rows(1, 2, 3)))
+    updates = to_frame([{"id": 2, "relevance_score": 90.0, "verdict": "High",
+                         "created_at": "2025-01-02T00:00:00"}] + rows(4))
+    merged = index.merge(updates, deleted_ids=[1])
+    assert sorted(merged.frame["id"].tolist()) == [2, 3, 4]
+    assert merged.filter(min_score=80)["id"].tolist() == [2]
+    assert merged.filter(verdict="High")["id"].tolist() == [2]
+    assert merged.watermark() == (4, pd.Timestamp("2025-01-04").isoformat())
+    # the original index is left untouched
+    assert sorted(index.frame["id"].tolist()) == [1, 2, 3]
+
+
+def test_index_merge_delete_only_and_unknown_ids():
+    index = EvaluationIndex(to_frame(rows(1, 2)))
+    merged = index.merge(None, deleted_ids=[2, 99])
+    assert merged.frame["id"].tolist() == [1]
+    assert len(merged.filter(min_score=0)) == 1
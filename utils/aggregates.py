@@ -0,0 +1,41 @@
+# utils/aggregates.py
+from utils.evaluations import evaluation_frame
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+SCORE_RANGE = (0.0, 100.0)
+DEFAULT_BINS = 10
+
+
+def score_histogram(scores, bins=DEFAULT_BINS):
+    counts, edges = np.histogram(np.asarray(scores, dtype=np.float64), bins=bins, range=SCORE_RANGE)
+    return {"edges": edges.tolist(), "counts": counts.tolist()}
+
+
+def summarize(users, evaluations, jobs, bins=DEFAULT_BINS, frame_key=None):
+    """Overview numbers in the same shape as the backend /admin/summary endpoint.
+
+    Unscored evaluations stay out of the average and histogram and are
+    counted separately as "unscored_evaluations". `frame_key` is passed
+    to evaluation_frame() so a repeated summary reuses the typed frame.
+    """
+    n = len(evaluations)
+    scores = np.zeros(0, dtype=np.float32)
+    verdicts = {}
+    if n:
+        frame = evaluation_frame(evaluations, frame_key)
+        if "relevance_score" in frame:
+            scores = frame["relevance_score"].dropna().to_numpy()
+        if "verdict" in frame:
+            counts = frame["verdict"].value_counts(sort=False)
+            verdicts = {str(k): int(v) for k, v in counts.items() if v}
+    return {
+        "total_users": len(users),
+        "total_evaluations": n,
+        "unscored_evaluations": n - len(scores),
+        "active_jobs": int(sum(1 for j in jobs if j.get("is_active"))),
+        "avg_score": float(scores.mean()) if len(scores) else None,
+        "histogram": score_histogram(scores, bins),
+        "verdict_counts": verdicts,
+    }
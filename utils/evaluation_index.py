@@ -0,0 +1,113 @@
+# utils/evaluation_index.py
+import os
+import threading
+import time
+from dotenv import load_dotenv
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+load_dotenv()
+# seconds before a loaded index is considered stale and pulled again
+EVALUATION_INDEX_TTL = float(os.getenv("EVALUATION_INDEX_TTL", "60"))
+
+
+class EvaluationIndex:
+    """Evaluations held locally for instant score-range and verdict filtering.
+
+    Scores are sorted once; a range query is two binary searches and the
+    verdict filter is a boolean bitmap sliced to that range, so slider
+    moves never touch the API.
+    """
+
+    def __init__(self, frame: "pd.DataFrame"):
+        self.frame = frame.reset_index(drop=True)
+        n = len(self.frame)
+        if "relevance_score" in self.frame:
+            scores = self.frame["relevance_score"].to_numpy(dtype=np.float32, na_value=np.nan)
+        else:
+            scores = np.full(n, np.nan, dtype=np.float32)
+        # NaN sorts last, so unscored rows fall outside any explicit range
+        self._order = np.argsort(scores, kind="stable")
+        self._sorted = scores[self._order]
+        self._scored = int(np.count_nonzero(~np.isnan(scores)))
+
+        self._verdicts = {}
+        if "verdict" in self.frame:
+            codes, labels = pd.factorize(self.frame["verdict"])
+            sorted_codes = codes[self._order]
+            self._verdicts = {label: sorted_codes == i for i, label in enumerate(labels)}
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def verdicts(self):
+        return list(self._verdicts)
+
+    def query(self, min_score=None, max_score=None, verdict=None):
+        """Row positions (in frame order) with min_score <= score <= max_score and the given verdict."""
+        lo, hi = 0, len(self._sorted)
+        if min_score is not None or max_score is not None:
+            hi = self._scored  # any score bound excludes unscored rows
+        if min_score is not None:
+            lo = int(np.searchsorted(self._sorted[:hi], min_score, side="left"))
+        if max_score is not None:
+            hi = int(np.searchsorted(self._sorted[:hi], max_score, side="right"))
+        rows = self._order[lo:hi]
+        if verdict is not None:
+            mask = self._verdicts.get(verdict)
+            rows = rows[mask[lo:hi]] if mask is not None else rows[:0]
+        # back to frame order: scatter into a bitmap instead of sorting
+        keep = np.zeros(len(self._order), dtype=bool)
+        keep[rows] = True
+        return np.flatnonzero(keep)
+
+    def filter(self, min_score=None, max_score=None, verdict=None):
+        return self.frame.iloc[self.query(min_score, max_score, verdict)]
+
+    def watermark(self):
+        """(max id, max created_at as ISO string) of the indexed rows, for delta sync."""
+        max_id = max_created = None
+        if "id" in self.frame and self.frame["id"].notna().any():
+            max_id = int(self.frame["id"].max())
+        if "created_at" in self.frame:
+            created = pd.to_datetime(self.frame["created_at"], errors="coerce").max()
+            if pd.notna(created):
+                max_created = created.isoformat()
+        return max_id, max_created
+
+    def merge(self, updates: "pd.DataFrame" = None, deleted_ids=()):
+        """New index with `updates` upserted by id and `deleted_ids` removed."""
+        frame = self.frame
+        drop = set(deleted_ids)
+        if updates is not None and len(updates) and "id" in updates:
+            drop.update(updates["id"].tolist())
+        if drop and "id" in frame:
+            frame = frame[~frame["id"].isin(drop)]
+        if updates is not None and len(updates):
+            frame = pd.concat([frame, updates], ignore_index=True)
+        return EvaluationIndex(frame)
+
+
+# -----------------------
+# Shared instances
+# -----------------------
+_indexes = {}  # key -> (loaded_at, EvaluationIndex)
+_lock = threading.Lock()
+
+
+def peek_index(key):
+    """(index, age in seconds) for a stored index, or None."""
+    with _lock:
+        entry = _indexes.get(key)
+    if entry is None:
+        return None
+    return entry[1], time.monotonic() - entry[0]
+
+
+def store_index(key, index):
+    with _lock:
+        _indexes[key] = (time.monotonic(), index)
+    return index
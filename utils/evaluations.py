@@ -0,0 +1,67 @@
+# utils/evaluations.py
+import threading
+from collections import OrderedDict
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+VERDICTS = ["High", "Medium", "Low"]
+SCORE_COLUMNS = ["relevance_score", "hard_match_score", "semantic_match_score"]
+ID_COLUMNS = ["id", "user_id", "job_id"]
+TABLE_COLUMNS = ["id", "user_id", "relevance_score", "verdict", "created_at"]
+FRAME_CACHE_SIZE = 8
+
+
+def to_frame(records):
+    """Build a typed evaluations DataFrame from a list of evaluation dicts.
+
+    Scores are float32, verdict is categorical (High/Medium/Low first),
+    created_at is datetime64 and ids are nullable integers; any other
+    columns are kept as they come.
+    """
+    df = pd.DataFrame.from_records(records)
+    for col in SCORE_COLUMNS:
+        if col in df:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(np.float32)
+    for col in ID_COLUMNS:
+        if col in df:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+    if "verdict" in df:
+        extra = sorted(set(df["verdict"].dropna().unique()) - set(VERDICTS))
+        df["verdict"] = pd.Categorical(df["verdict"], categories=VERDICTS + extra)
+    if "created_at" in df:
+        df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce")
+    return df
+
+
+# -----------------------
+# Versioned frame cache
+# -----------------------
+# keyed by where the records came from and which version of it they are,
+# e.g. (url, read-cache entry version), (url, params, sync version) or
+# (url, ETag): every rerun and session showing that version reuses one frame
+_frames = OrderedDict()  # key -> frame
+_lock = threading.Lock()
+
+
+def evaluation_frame(records, key=None):
+    """Typed frame for `records`, built once per `key`. Treat it as read-only.
+
+    `key` must change whenever the records do; without one the frame is
+    built fresh and not cached.
+    """
+    if key is None:
+        return to_frame(records)
+    with _lock:
+        frame = _frames.get(key)
+        if frame is not None:
+            _frames.move_to_end(key)
+            return frame
+    frame = to_frame(records)
+    with _lock:
+        _frames[key] = frame
+        _frames.move_to_end(key)
+        while len(_frames) > FRAME_CACHE_SIZE:
+            _frames.popitem(last=False)
+    return frame
@@ -0,0 +1,112 @@
+# utils/extraction_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv()
+# set EXTRACTION_CACHE_DIR="" to keep extracted resume text in memory only
+EXTRACTION_CACHE_DIR = os.getenv(
+    "EXTRACTION_CACHE_DIR", os.path.join(tempfile.gettempdir(), "resume_extractions"))
+EXTRACTION_CACHE_MEMORY_ENTRIES = int(os.getenv("EXTRACTION_CACHE_MEMORY_ENTRIES", "128"))
+EXTRACTION_CACHE_DISK_BYTES = int(os.getenv("EXTRACTION_CACHE_DISK_BYTES", str(128 * 1024 * 1024)))
+
+CACHED_FIELDS = ("extracted_text", "word_count")
+
+
+def content_key(data):
+    """sha256 of the uploaded bytes (bytes, bytearray or memoryview)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExtractionCache:
+    """Two-level (memory LRU + on-disk) cache of text extracted from uploads."""
+
+    def __init__(self, directory=EXTRACTION_CACHE_DIR, max_entries=EXTRACTION_CACHE_MEMORY_ENTRIES,
+                 max_disk_bytes=EXTRACTION_CACHE_DISK_BYTES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return dict(self._memory[key])
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)  # mtime doubles as the disk LRU clock
+        except (OSError, ValueError):
+            return None
+        self._remember(key, value)
+        return dict(value)
+
+    def put(self, key, result):
+        value = {k: result[k] for k in CACHED_FIELDS if k in result}
+        if "extracted_text" not in value:
+            return
+        self._remember(key, value)
+        if not self.directory:
+            return
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp, self._path(key))
+            self._prune_disk()
+        except OSError:
+            pass
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _prune_disk(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.name.endswith(".json"):
+                    st = e.stat()
+                    entries.append((st.st_mtime, st.st_size, e.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+# -----------------------
+# Shared instance
+# -----------------------
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ExtractionCache()
+    return _cache
@@ -0,0 +1,254 @@
+# utils/helpers.py
+import re
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Same split the backend reports in student_app.display_results
+WEIGHT_HARD = 0.3
+WEIGHT_SEMANTIC = 0.7
+# good-to-have skills / keywords count half as much as must-haves
+NICE_TO_HAVE_WEIGHT = 0.5
+MAX_SKILL_WORDS = 3
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in is it its of on or our that the their this
+to was we were will with you your i my me he she they them who which what when where how
+""".split())
+
+# alias -> canonical skill; applied to JD skills, resume phrases and TF-IDF terms alike
+# (no "cv": in a resume it almost always means curriculum vitae)
+SYNONYMS = {
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "nlp": "natural language processing",
+    "ai": "artificial intelligence",
+    "sklearn": "scikit-learn",
+    "reactjs": "react",
+    "react.js": "react",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "postgres": "postgresql",
+    "k8s": "kubernetes",
+    "golang": "go",
+    "gcp": "google cloud",
+    "ms excel": "excel",
+    "powerbi": "power bi",
+}
+
+
+# -----------------------
+# Text normalization
+# -----------------------
+def tokenize(text):
+    tokens = _TOKEN_RE.findall((text or "").lower())
+    return [t.rstrip(".-") for t in tokens if t.rstrip(".-")]
+
+
+def normalize_skill(skill):
+    return " ".join(tokenize(skill))
+
+
+def terms(text, synonyms=SYNONYMS):
+    """TF-IDF terms: tokens without stopwords, aliases expanded to their canonical words."""
+    out = []
+    for token in tokenize(text):
+        if token in STOPWORDS:
+            continue
+        canon = synonyms.get(token)
+        out.extend(canon.split() if canon else (token,))
+    return out
+
+
+def unwrap_list(payload):
+    """Accept both plain lists and {"status": "success", "data": [...]} envelopes."""
+    if isinstance(payload, dict) and payload.get("status") == "success":
+        return payload.get("data", [])
+    return payload if isinstance(payload, list) else []
+
+
+def job_text(job):
+    return job.get("description_text") or job.get("description") or ""
+
+
+def job_skills(job, synonyms=SYNONYMS):
+    """(must_have, nice_to_have) normalized, canonical skill lists for a job payload."""
+    def canonical(skills):
+        return (synonyms.get(s, s) for s in map(normalize_skill, skills) if s)
+
+    must = list(job.get("required_skills") or []) + list(job.get("must_have_skills") or [])
+    nice = list(job.get("good_to_have_skills") or []) + list(job.get("keywords") or [])
+    must = list(dict.fromkeys(canonical(must)))
+    nice = list(dict.fromkeys(s for s in canonical(nice) if s not in must))
+    return must, nice
+
+
+def ngrams(tokens, max_n=MAX_SKILL_WORDS):
+    grams = set(tokens)
+    for n in range(2, max_n + 1):
+        grams.update(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return grams
+
+
+def skill_grams(text, synonyms=SYNONYMS):
+    """Canonical skill phrases (1-3 words) present in a text."""
+    return {synonyms.get(g, g) for g in ngrams(tokenize(text))}
+
+
+# -----------------------
+# Hard-skill match
+# -----------------------
+def skill_presence(texts, skills):
+    """Boolean matrix [len(texts), len(skills)]: skill phrase appears in text."""
+    index = {skill: k for k, skill in enumerate(skills)}
+    out = np.zeros((len(texts), len(skills)), dtype=bool)
+    for i, text in enumerate(texts):
+        hits = [index[g] for g in skill_grams(text) if g in index]
+        out[i, hits] = True
+    return out
+
+
+def hard_match_matrix(resume_texts, jobs):
+    """Hard-skill scores [N, M] in 0-100 plus the shared skill vocabulary.
+
+    Jobs without any listed skills get NaN so callers can fall back.
+    """
+    per_job = [job_skills(j) for j in jobs]
+    skills = list(dict.fromkeys(s for must, nice in per_job for s in must + nice))
+    col = {s: k for k, s in enumerate(skills)}
+    weights = np.zeros((len(jobs), len(skills)), dtype=np.float32)
+    for m, (must, nice) in enumerate(per_job):
+        weights[m, [col[s] for s in nice]] = NICE_TO_HAVE_WEIGHT
+        weights[m, [col[s] for s in must]] = 1.0
+
+    present = skill_presence(resume_texts, skills).astype(np.float32)
+    total = weights.sum(axis=1)
+    matched = present @ weights.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores = np.where(total > 0, matched / total * 100.0, np.nan)
+    return scores.astype(np.float32), present.astype(bool), skills
+
+
+# -----------------------
+# Semantic (TF-IDF cosine)
+# -----------------------
+def _tfidf(docs_tokens, corpus_start=0, corpus=None):
+    """Sparse TF-IDF as COO arrays (rows, terms, values) plus per-doc L2 norms.
+
+    IDF is taken over `corpus` (token lists) when given, else over
+    docs_tokens[corpus_start:] (the JDs) — never over resumes, so a resume
+    scores the same however many other resumes are in the batch.
+    """
+    vocab = {}
+    rows, ids, counts = [], [], []
+    for i, tokens in enumerate(docs_tokens):
+        doc = np.fromiter((vocab.setdefault(t, len(vocab)) for t in tokens), dtype=np.int64)
+        uniq, cnt = np.unique(doc, return_counts=True)
+        rows.append(np.full(len(uniq), i, dtype=np.int64))
+        ids.append(uniq)
+        counts.append(cnt)
+
+    n = len(docs_tokens)
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    ids = np.concatenate(ids) if ids else np.zeros(0, dtype=np.int64)
+    counts = np.concatenate(counts) if counts else np.zeros(0, dtype=np.int64)
+
+    if corpus is None:
+        df = np.bincount(ids[rows >= corpus_start], minlength=len(vocab))
+        n_corpus = n - corpus_start
+    else:
+        df = np.zeros(len(vocab), dtype=np.int64)
+        for tokens in corpus:
+            seen = [vocab[t] for t in set(tokens) if t in vocab]
+            df[seen] += 1
+        n_corpus = len(corpus)
+    idf = np.log((1.0 + n_corpus) / (1.0 + df)) + 1.0
+    values = (1.0 + np.log(counts)) * idf[ids]  # sublinear tf
+    norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=n))
+    return rows, ids, values.astype(np.float32), norms.astype(np.float32)
+
+
+def semantic_matrix(resume_texts, jd_texts, corpus_texts=None):
+    """Cosine similarity [N, M] in 0-100 between resumes and JDs.
+
+    IDF comes from corpus_texts (e.g. every JD on offer, as JDIndex uses)
+    or, by default, from jd_texts.
+
+    Dense matrices are built only over terms that occur in some JD;
+    other resume terms cannot contribute to a dot product but are kept
+    in the resume norms, so the result equals the full cosine.
+    """
+    n, m = len(resume_texts), len(jd_texts)
+    if not n or not m:
+        return np.zeros((n, m), dtype=np.float32)
+    corpus = [terms(t) for t in corpus_texts] if corpus_texts is not None else None
+    rows, ids, values, norms = _tfidf([terms(t) for t in list(resume_texts) + list(jd_texts)],
+                                      corpus_start=n, corpus=corpus)
+
+    is_jd = rows >= n
+    cols, jd_col = np.unique(ids[is_jd], return_inverse=True)
+    J = np.zeros((m, len(cols)), dtype=np.float32)
+    J[rows[is_jd] - n, jd_col] = values[is_jd]
+
+    in_jd_vocab = ~is_jd & np.isin(ids, cols)
+    R = np.zeros((n, len(cols)), dtype=np.float32)
+    R[rows[in_jd_vocab], np.searchsorted(cols, ids[in_jd_vocab])] = values[in_jd_vocab]
+
+    denom = np.outer(norms[:n], norms[n:])
+    sim = np.divide(R @ J.T, denom, out=np.zeros((n, m), dtype=np.float32), where=denom > 0)
+    return np.clip(sim * 100.0, 0.0, 100.0)
+
+
+# -----------------------
+# Combined scoring
+# -----------------------
+def verdict_for(score):
+    return "High" if score >= 70 else "Medium" if score >= 40 else "Low"
+
+
+def score_matrix(resume_texts, jobs, corpus=None):
+    """Score N resumes against M job payloads in one pass.
+
+    Returns {"hard", "semantic", "relevance"} float32 arrays of shape
+    [N, M]. Jobs that list no skills use the semantic score as their
+    hard score. `corpus` (job payloads) sets the IDF; defaults to `jobs`.
+    """
+    corpus_texts = [job_text(j) for j in corpus] if corpus is not None else None
+    semantic = semantic_matrix(resume_texts, [job_text(j) for j in jobs], corpus_texts)
+    hard, _, _ = hard_match_matrix(resume_texts, jobs)
+    hard = np.where(np.isnan(hard), semantic, hard).astype(np.float32)
+    relevance = (WEIGHT_HARD * hard + WEIGHT_SEMANTIC * semantic).astype(np.float32)
+    return {"hard": hard, "semantic": semantic, "relevance": relevance}
+
+
+def suggestions_for(missing_skills, limit=5):
+    tips = [f"Add evidence of {skill} (projects, internships or certifications)."
+            for skill in missing_skills[:limit]]
+    if not tips:
+        tips.append("Quantify your achievements to strengthen an already good match.")
+    return tips
+
+
+def score_resume(resume_text, job, corpus=None):
+    """Local estimate shaped like a backend evaluation result.
+
+    Pass every JD on offer as `corpus` to score exactly as JDIndex.match does.
+    """
+    scores = score_matrix([resume_text], [job], corpus)
+    must, nice = job_skills(job)
+    present = skill_presence([resume_text], must + nice)[0]
+    missing = [s for s, ok in zip(must + nice, present) if not ok]
+    relevance = float(scores["relevance"][0, 0])
+    return {
+        "relevance_score": relevance,
+        "hard_match_score": float(scores["hard"][0, 0]),
+        "semantic_match_score": float(scores["semantic"][0, 0]),
+        "verdict": verdict_for(relevance),
+        "missing_skills": missing,
+        "suggestions": suggestions_for(missing),
+        "source": "local",
+    }
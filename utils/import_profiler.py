@@ -0,0 +1,144 @@
+# utils/import_profiler.py
+import os
+import sys
+import threading
+import time
+
+# set to 1 to time every module imported after the profiler is installed
+IMPORT_PROFILE = os.getenv("IMPORT_PROFILE", "0") == "1"
+
+
+class _TimedLoader:
+    """Wraps a loader to time create_module + exec_module of one module."""
+
+    def __init__(self, loader, name, profiler):
+        self._loader = loader
+        self._name = name
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        self._profiler._enter(self._name)
+        try:
+            return self._loader.create_module(spec) if hasattr(self._loader, "create_module") else None
+        except BaseException:
+            self._profiler._exit(self._name)
+            raise
+
+    def exec_module(self, module):
+        # hand the real loader back to the module before its code runs
+        module.__loader__ = self._loader
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self._loader
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class ImportProfiler:
+    """Per-module import time, recorded through a sys.meta_path hook.
+
+    "total" includes the imports a module triggers itself, "self"
+    excludes them. Only the first import of a module is measured;
+    modules already in sys.modules cost nothing and are not listed.
+    """
+
+    def __init__(self):
+        self.timings = {}  # name -> {"total", "self", "order"}
+        self._stack = threading.local()
+        self._lock = threading.Lock()
+        self._installed = False
+
+    # -----------------------
+    # sys.meta_path finder
+    # -----------------------
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, name, self)
+        return spec
+
+    def _frames(self):
+        frames = getattr(self._stack, "frames", None)
+        if frames is None:
+            frames = self._stack.frames = []
+        return frames
+
+    def _enter(self, name):
+        # [name, start, time spent in nested imports]
+        self._frames().append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name):
+        frames = self._frames()
+        if not frames or frames[-1][0] != name:
+            return
+        _, start, nested = frames.pop()
+        total = time.perf_counter() - start
+        if frames:
+            frames[-1][2] += total
+        with self._lock:
+            self.timings[name] = {"total": total, "self": total - nested, "order": len(self.timings)}
+
+    # -----------------------
+    # Control / report
+    # -----------------------
+    def install(self):
+        if not self._installed:
+            sys.meta_path.insert(0, self)
+            self._installed = True
+        return self
+
+    def uninstall(self):
+        if self._installed:
+            sys.meta_path.remove(self)
+            self._installed = False
+
+    def report(self, limit=20, sort="total"):
+        """[(module, total_ms, self_ms)] slowest first."""
+        with self._lock:
+            rows = sorted(self.timings.items(), key=lambda kv: kv[1][sort], reverse=True)
+        return [(name, t["total"] * 1000.0, t["self"] * 1000.0) for name, t in rows[:limit]]
+
+    def format_report(self, limit=20):
+        lines = [f"{'total ms':>9} {'self ms':>9}  module"]
+        lines += [f"{total:9.1f} {own:9.1f}  {name}" for name, total, own in self.report(limit)]
+        return "\n".join(lines)
+
+
+# -----------------------
+# Shared instance
+# -----------------------
+_profiler = None
+
+
+def get_import_profiler():
+    """The installed process-wide profiler, or None unless IMPORT_PROFILE=1."""
+    global _profiler
+    if IMPORT_PROFILE and _profiler is None:
+        _profiler = ImportProfiler().install()
+    return _profiler
+
+
+def show_report(container, limit=15):
+    """Render the slowest imports into a Streamlit container; no-op when profiling is off."""
+    profiler = get_import_profiler()
+    if profiler is not None:
+        container.expander("⏱ Import times").code(profiler.format_report(limit))
+
+
+if __name__ == "__main__":
+    # python -m utils.import_profiler main_app  -> import cost of a module tree
+    profiler = ImportProfiler().install()
+    for target in sys.argv[1:] or ["main_app"]:
+        __import__(target)
+    print(profiler.format_report())
@@ -0,0 +1,178 @@
+# utils/jd_index.py
+import hashlib
+import json
+import math
+import threading
+from collections import Counter, defaultdict
+from utils.helpers import (
+    NICE_TO_HAVE_WEIGHT, SYNONYMS, WEIGHT_HARD, WEIGHT_SEMANTIC,
+    job_skills, job_text, normalize_skill, skill_grams, terms, unwrap_list, verdict_for,
+)
+
+_FINGERPRINT_FIELDS = ("title", "description_text", "description", "required_skills",
+                       "must_have_skills", "good_to_have_skills", "keywords", "is_active")
+
+
+def _fingerprint(job):
+    raw = json.dumps({k: job.get(k) for k in _FINGERPRINT_FIELDS}, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+class JDIndex:
+    """In-process index of job descriptions for fast resume matching.
+
+    Each job is tokenized once into canonical skills and a sparse term
+    vector; inverted postings (skill -> jobs, term -> jobs) turn matching
+    a resume against every JD into lookups plus a sparse dot product.
+    update() only re-indexes jobs whose relevant fields changed. IDF is
+    taken over the indexed JDs and recomputed lazily after changes.
+    Tokens, synonyms and weights are those of utils.helpers.score_matrix,
+    so both give the same scores for the same resume and JD.
+    """
+
+    def __init__(self, synonyms=None):
+        self.synonyms = {normalize_skill(k): normalize_skill(v)
+                         for k, v in (synonyms or SYNONYMS).items()}
+        self._lock = threading.RLock()
+        self._jobs = {}                          # job_id -> entry
+        self._skill_postings = defaultdict(dict)  # skill -> {job_id: weight}
+        self._term_postings = defaultdict(dict)   # term -> {job_id: tf weight}
+        self._idf = {}
+        self._norms = {}
+        self._stale = True
+
+    # -----------------------
+    # Normalization
+    # -----------------------
+    def terms(self, text):
+        return terms(text, self.synonyms)
+
+    # -----------------------
+    # Maintenance
+    # -----------------------
+    def update(self, jobs):
+        """Sync the index with the given job list; returns (added, changed, removed) ids."""
+        jobs = {j["id"]: j for j in unwrap_list(jobs) if "id" in j}
+        added, changed = [], []
+        with self._lock:
+            removed = [jid for jid in self._jobs if jid not in jobs]
+            for jid in removed:
+                self._remove(jid)
+            for jid, job in jobs.items():
+                fp = _fingerprint(job)
+                entry = self._jobs.get(jid)
+                if entry is not None and entry["fingerprint"] == fp:
+                    continue
+                (changed if entry is not None else added).append(jid)
+                if entry is not None:
+                    self._remove(jid)
+                self._add(jid, job, fp)
+            if added or changed or removed:
+                self._stale = True
+        return added, changed, removed
+
+    def _add(self, jid, job, fingerprint):
+        must, nice = job_skills(job, self.synonyms)
+        weights = {s: 1.0 for s in must}
+        weights.update({s: NICE_TO_HAVE_WEIGHT for s in nice})
+        tf = {t: 1.0 + math.log(c) for t, c in Counter(self.terms(job_text(job))).items()}
+
+        for skill, w in weights.items():
+            self._skill_postings[skill][jid] = w
+        for term, w in tf.items():
+            self._term_postings[term][jid] = w
+        self._jobs[jid] = {
+            "fingerprint": fingerprint,
+            "job": job,
+            "skills": weights,
+            "skill_total": sum(weights.values()),
+            "terms": tf,
+        }
+
+    def _remove(self, jid):
+        entry = self._jobs.pop(jid)
+        for skill in entry["skills"]:
+            self._skill_postings[skill].pop(jid, None)
+            if not self._skill_postings[skill]:
+                del self._skill_postings[skill]
+        for term in entry["terms"]:
+            self._term_postings[term].pop(jid, None)
+            if not self._term_postings[term]:
+                del self._term_postings[term]
+
+    def _refresh_weights(self):
+        n = len(self._jobs)
+        self._idf = {t: math.log((1.0 + n) / (1.0 + len(p))) + 1.0
+                     for t, p in self._term_postings.items()}
+        self._norms = {jid: math.sqrt(sum((w * self._idf[t]) ** 2 for t, w in e["terms"].items()))
+                       for jid, e in self._jobs.items()}
+        self._stale = False
+
+    def __len__(self):
+        return len(self._jobs)
+
+    # -----------------------
+    # Matching
+    # -----------------------
+    def match(self, resume_text, active_only=True, top_k=None):
+        """Score a resume against every indexed job, best first."""
+        grams = skill_grams(resume_text, self.synonyms)
+        tf = {t: 1.0 + math.log(c) for t, c in Counter(self.terms(resume_text)).items()}
+
+        with self._lock:
+            if self._stale:
+                self._refresh_weights()
+            matched = defaultdict(float)
+            for skill in grams:
+                for jid, w in self._skill_postings.get(skill, {}).items():
+                    matched[jid] += w
+
+            dots = defaultdict(float)
+            resume_sq = 0.0
+            for term, w in tf.items():
+                # unseen terms still count towards the resume norm (idf as if df=0)
+                idf = self._idf.get(term, math.log(1.0 + len(self._jobs)) + 1.0)
+                rw = w * idf
+                resume_sq += rw * rw
+                for jid, jw in self._term_postings.get(term, {}).items():
+                    dots[jid] += rw * jw * idf
+            resume_norm = math.sqrt(resume_sq)
+
+            results = []
+            for jid, entry in self._jobs.items():
+                job = entry["job"]
+                if active_only and not job.get("is_active", True):
+                    continue
+                denom = resume_norm * self._norms.get(jid, 0.0)
+                semantic = min(100.0, dots.get(jid, 0.0) / denom * 100.0) if denom else 0.0
+                total = entry["skill_total"]
+                hard = matched.get(jid, 0.0) / total * 100.0 if total else semantic
+                relevance = WEIGHT_HARD * hard + WEIGHT_SEMANTIC * semantic
+                results.append({
+                    "job_id": jid,
+                    "title": job.get("title"),
+                    "company": job.get("company"),
+                    "relevance_score": relevance,
+                    "hard_match_score": hard,
+                    "semantic_match_score": semantic,
+                    "verdict": verdict_for(relevance),
+                    "missing_skills": [s for s in entry["skills"] if s not in grams],
+                })
+        results.sort(key=lambda r: r["relevance_score"], reverse=True)
+        return results[:top_k] if top_k else results
+
+
+# -----------------------
+# Shared instance
+# -----------------------
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_jd_index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = JDIndex()
+    return _index
@@ -0,0 +1,47 @@
+# utils/lazy.py
+import importlib
+import sys
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Lets pages and helpers keep the usual `pd.` / `np.` / `px.` spelling
+    while pandas, numpy and plotly only load once something actually
+    uses them, so pages that never do (login, register...) start cold
+    without them.
+    """
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self._name)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    """Return the module if already imported, else a LazyModule for it."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def is_loaded(name):
+    return name in sys.modules
@@ -0,0 +1,157 @@
+# utils/local_store.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+# path of the SQLite file; empty disables local persistence
+LOCAL_STORE_PATH = os.getenv("LOCAL_STORE_PATH", "")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER,
+    job_id INTEGER,
+    verdict TEXT,
+    relevance_score REAL,
+    created_at TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_evaluations_job ON evaluations(job_id);
+CREATE INDEX IF NOT EXISTS ix_evaluations_user ON evaluations(user_id);
+CREATE INDEX IF NOT EXISTS ix_evaluations_verdict ON evaluations(verdict);
+CREATE INDEX IF NOT EXISTS ix_evaluations_score ON evaluations(relevance_score);
+-- jobs / resumes were only ever read back as raw responses
+DROP TABLE IF EXISTS jobs;
+DROP TABLE IF EXISTS resumes;
+"""
+
+# table -> (indexed columns, row builder)
+_TABLES = {
+    "evaluations": (("id", "user_id", "job_id", "verdict", "relevance_score", "created_at"),
+                    lambda r: (r["id"], r.get("user_id"), r.get("job_id"), r.get("verdict"),
+                               r.get("relevance_score"), r.get("created_at"))),
+}
+
+
+class LocalStore:
+    """SQLite persistence for API payloads, shared by all sessions of a process.
+
+    Keeps raw list responses with their validators (so a fresh process
+    can warm-start, revalidate with a cheap 304 and fall back to them when
+    the backend is down) and typed evaluation rows for indexed local
+    queries.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        with self._conn() as conn:
+            conn.executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # -----------------------
+    # Raw responses
+    # -----------------------
+    def save_response(self, url, body, etag=None, last_modified=None):
+        with self._write_lock, self._conn() as conn:
+            conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                         (url, etag, last_modified, body, time.time()))
+
+    def load_response(self, url):
+        """{"body", "etag", "last_modified", "stored_at"} or None."""
+        row = self._conn().execute(
+            "SELECT body, etag, last_modified, stored_at FROM responses WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    def invalidate_prefix(self, prefix):
+        with self._write_lock, self._conn() as conn:
+            conn.execute("DELETE FROM responses WHERE substr(url, 1, ?) = ?", (len(prefix), prefix))
+
+    # -----------------------
+    # Typed rows
+    # -----------------------
+    def _rows(self, table, records):
+        _, build = _TABLES[table]
+        if isinstance(records, dict) and records.get("status") == "success":
+            records = records.get("data", [])
+        return [build(r) + (json.dumps(r),) for r in records if isinstance(r, dict) and "id" in r]
+
+    def replace_records(self, table, records):
+        columns, _ = _TABLES[table]
+        rows = self._rows(table, records)
+        marks = ", ".join("?" * (len(columns) + 1))
+        with self._write_lock, self._conn() as conn:
+            conn.execute(f"DELETE FROM {table}")
+            conn.executemany(f"INSERT INTO {table} VALUES ({marks})", rows)
+
+    def upsert_records(self, table, records):
+        columns, _ = _TABLES[table]
+        rows = self._rows(table, records)
+        marks = ", ".join("?" * (len(columns) + 1))
+        with self._write_lock, self._conn() as conn:
+            conn.executemany(f"INSERT OR REPLACE INTO {table} VALUES ({marks})", rows)
+
+    def delete_records(self, table, ids):
+        with self._write_lock, self._conn() as conn:
+            conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(i,) for i in ids])
+
+    def load_records(self, table):
+        return [json.loads(row[0]) for row in
+                self._conn().execute(f"SELECT payload FROM {table} ORDER BY id")]
+
+    def query_evaluations(self, min_score=None, max_score=None, verdict=None,
+                          user_id=None, job_id=None, limit=None):
+        clauses, params = [], []
+        for clause, value in (("relevance_score >= ?", min_score), ("relevance_score <= ?", max_score),
+                              ("verdict = ?", verdict), ("user_id = ?", user_id), ("job_id = ?", job_id)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        sql = "SELECT payload FROM evaluations"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [json.loads(row[0]) for row in self._conn().execute(sql, params)]
+
+
+# -----------------------
+# Shared instance
+# -----------------------
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_local_store():
+    """Process-wide LocalStore, or None when LOCAL_STORE_PATH is not set."""
+    global _store
+    if not LOCAL_STORE_PATH:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = LocalStore(LOCAL_STORE_PATH)
+    return _store
@@ -0,0 +1,235 @@
+# utils/rerun_profiler.py
+import contextvars
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# set to 1 to profile every rerun and show the breakdown in the sidebar
+RERUN_PROFILE = os.getenv("RERUN_PROFILE", "0") == "1"
+# opt in to also trace allocations per section (slower; tracemalloc is process-wide
+# and only runs while a profiled rerun is in progress)
+RERUN_PROFILE_MEMORY = os.getenv("RERUN_PROFILE_MEMORY", "0") == "1"
+RERUN_HISTORY = int(os.getenv("RERUN_HISTORY", "20"))
+STATE_KEY = "_rerun_profiles"
+
+# profile of the rerun running in this context; asyncio.to_thread copies it,
+# so API calls made from fetch_concurrently workers are still attributed
+_active = contextvars.ContextVar("rerun_profile", default=None)
+
+# reruns (across sessions) currently tracing allocations; tracemalloc is
+# stopped again when the last one finishes, unless someone else started it
+_tracing = {"users": 0, "owned": False}
+_tracing_lock = threading.Lock()
+
+
+def _acquire_tracing():
+    with _tracing_lock:
+        if _tracing["users"] == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing["owned"] = True
+        _tracing["users"] += 1
+
+
+def _release_tracing():
+    with _tracing_lock:
+        _tracing["users"] -= 1
+        if _tracing["users"] == 0 and _tracing["owned"]:
+            tracemalloc.stop()
+            _tracing["owned"] = False
+
+
+class Section:
+    __slots__ = ("name", "start", "wall", "mem_start", "alloc", "peak", "api_calls", "children")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.wall = 0.0
+        self.mem_start = 0
+        self.alloc = 0       # net bytes still allocated at exit
+        self.peak = 0        # peak bytes above the level at entry
+        self.api_calls = 0   # made directly in this section
+        self.children = []
+
+    def total_calls(self):
+        return self.api_calls + sum(c.total_calls() for c in self.children)
+
+
+class RerunProfile:
+    """Nested timing / allocation / API-call record of one script rerun."""
+
+    def __init__(self, label, trigger=(), memory=RERUN_PROFILE_MEMORY):
+        self.label = label
+        self.trigger = list(trigger)
+        self.memory = memory and tracemalloc.is_tracing()
+        self.root = Section(label)
+        self.stack = []
+        self.finished_at = None
+        self._enter(self.root)
+        self.stack.append(self.root)
+
+    def _sample(self):
+        if not self.memory:
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        for s in self.stack:
+            s.peak = max(s.peak, peak - s.mem_start)
+        tracemalloc.reset_peak()
+        return current
+
+    def _enter(self, section):
+        # sample before the section joins the stack so only its parents are updated
+        section.mem_start = self._sample()
+        section.start = time.perf_counter()
+
+    def _exit(self, section):
+        section.wall = time.perf_counter() - section.start
+        section.alloc = self._sample() - section.mem_start
+
+    def push(self, name):
+        section = Section(name)
+        self.stack[-1].children.append(section)
+        self._enter(section)
+        self.stack.append(section)
+        return section
+
+    def pop(self, section):
+        self._exit(section)
+        if self.stack and self.stack[-1] is section:
+            self.stack.pop()
+
+    def finish(self):
+        while len(self.stack) > 1:
+            self.pop(self.stack[-1])
+        self._exit(self.root)
+        self.stack = []
+        self.finished_at = time.time()
+
+    def rows(self):
+        """Flattened (depth, section) pairs, depth-first."""
+        out = []
+
+        def walk(section, depth):
+            out.append((depth, section))
+            for child in section.children:
+                walk(child, depth + 1)
+        walk(self.root, 0)
+        return out
+
+
+# -----------------------
+# Recording
+# -----------------------
+def count_api_call():
+    """Called by components.transport for each request; cheap no-op when not profiling."""
+    profile = _active.get()
+    if profile is not None and profile.stack:
+        profile.stack[-1].api_calls += 1
+
+
+@contextmanager
+def section(name):
+    profile = _active.get()
+    if profile is None or not profile.stack:
+        yield
+        return
+    s = profile.push(name)
+    try:
+        yield
+    finally:
+        profile.pop(s)
+
+
+def profiled(name=None):
+    """Decorator form of section(); defaults to the function name."""
+    def wrap(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with section(label):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
+def _trigger(state):
+    # keyed widgets / values that changed since the previous rerun
+    previous = state.get(f"{STATE_KEY}_values", {})
+    current = {k: v for k, v in state.items()
+               if not str(k).startswith(STATE_KEY) and isinstance(v, (str, int, float, bool, type(None)))}
+    state[f"{STATE_KEY}_values"] = current
+    return [k for k in current if previous.get(k) != current[k]]
+
+
+def start(state, label="rerun"):
+    """Begin profiling this rerun; returns the profile or None when profiling is off."""
+    if not RERUN_PROFILE:
+        return None
+    if RERUN_PROFILE_MEMORY:
+        _acquire_tracing()
+    profile = RerunProfile(label, _trigger(state))
+    _active.set(profile)
+    return profile
+
+
+def finish(state, profile):
+    if profile is None or profile.finished_at is not None:
+        return
+    profile.finish()
+    _active.set(None)
+    if RERUN_PROFILE_MEMORY:
+        _release_tracing()
+    history = state.setdefault(STATE_KEY, [])
+    history.append(profile)
+    del history[:-RERUN_HISTORY]
+
+
+@contextmanager
+def rerun(state, label="rerun"):
+    profile = start(state, label)
+    try:
+        yield profile
+    finally:
+        finish(state, profile)
+
+
+# -----------------------
+# Report
+# -----------------------
+def _mb(n):
+    return f"{n / 1e6:+.1f} MB"
+
+
+def format_profile(profile, width=24):
+    total = profile.root.wall or 1e-9
+    lines = []
+    for depth, s in profile.rows():
+        filled = s.wall / total * width
+        bar = ("█" * int(filled) + ("▌" if filled - int(filled) >= 0.5 else "")).ljust(width)
+        calls = s.total_calls()
+        mem = f"  peak {_mb(s.peak)} net {_mb(s.alloc)}" if profile.memory else ""
+        lines.append(f"{bar} {s.wall * 1000:8.1f} ms  {'  ' * depth}{s.name}"
+                     f"{f'  [{calls} API]' if calls else ''}{mem}")
+    return "\n".join(lines)
+
+
+def format_history(history):
+    lines = [f"{'ms':>8} {'API':>4}  rerun / trigger"]
+    for p in reversed(history):
+        trigger = ", ".join(map(str, p.trigger[:3])) or "-"
+        lines.append(f"{p.root.wall * 1000:8.1f} {p.root.total_calls():4d}  {p.label} / {trigger}")
+    return "\n".join(lines)
+
+
+def show(container, state):
+    """Debug sidebar view: breakdown of the last finished rerun plus recent history."""
+    history = state.get(STATE_KEY) or []
+    if not RERUN_PROFILE or not history:
+        return
+    panel = container.expander("🔬 Rerun profile")
+    panel.code(format_profile(history[-1]))
+    panel.code(format_history(history))